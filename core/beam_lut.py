@@ -48,6 +48,8 @@ class CorrectedBeamLUT:
         self._config_0 = pd.DataFrame()
         self._config_1 = pd.DataFrame()
         self._interp: Dict[int, Dict[str, interp1d]] = {0: {}, 1: {}}
+        # (config, angle) -> (V_CH1, V_CH2); beam angles repeat every sweep step
+        self._voltage_cache: Dict[Tuple[int, float], Tuple[float, float]] = {}
         
         self._load()
     
@@ -106,6 +108,11 @@ class CorrectedBeamLUT:
         if config not in self._interp or not self._interp[config]:
             return 0.0, 0.0
         
+        key = (config, float(target_angle))
+        cached = self._voltage_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             v1 = float(self._interp[config]["V_CH1"](target_angle))
             v2 = float(self._interp[config]["V_CH2"](target_angle))
@@ -113,6 +120,9 @@ class CorrectedBeamLUT:
             # Clamp to valid range
             v1 = max(0.0, min(8.5, v1))
             v2 = max(0.0, min(8.5, v2))
+            if len(self._voltage_cache) >= 256:  # slider drags produce arbitrary angles
+                self._voltage_cache.clear()
+            self._voltage_cache[key] = (v1, v2)
             return v1, v2
             
         except Exception as e:
@@ -132,7 +142,7 @@ class CorrectedBeamLUT:
         config_df = self._config_0 if port_config == 0 else self._config_1
         if config_df.empty:
             return []
-        return sorted(config_df["Angle_Cmd_Deg"].unique().tolist())
+        return np.sort(config_df["Angle_Cmd_Deg"].unique()).tolist()
     
     def get_beam_presets(self, port_config: int) -> Dict[str, float]:
         """
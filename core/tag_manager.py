@@ -7,10 +7,16 @@ from JSON files.
 
 import json
 import os
-from typing import List, Dict, Optional, Tuple
+from collections import namedtuple
+from typing import List, Dict, FrozenSet, Optional, Tuple
 from dataclasses import dataclass, field
 
 
+# Column-wise (struct-of-arrays) view of the configured tags; tuples so the
+# cached view can be shared without callers mutating it
+TagColumns = namedtuple("TagColumns", ["suffixes", "labels", "locations", "suffix_set"])
+
+
 @dataclass
 class Tag:
     """Represents a single RFID tag with its configuration."""
@@ -38,24 +44,54 @@ class TagManager:
     tags: List[Tag] = field(default_factory=list)
     antenna_settings: Dict = field(default_factory=dict)
     
+    # Column cache; None means stale (see _invalidate_columns)
+    _columns: Optional[TagColumns] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Load configuration after initialization."""
         self.load()
     
+    @property
+    def columns(self) -> TagColumns:
+        """
+        Get suffixes, labels, locations and the suffix frozenset as parallel columns.
+        
+        Cached; rebuilt after load, add_tag, update_tag or remove_tag, so
+        labels and locations stay aligned with suffixes.
+        """
+        if self._columns is None:
+            suffixes = tuple(t.suffix for t in self.tags)
+            self._columns = TagColumns(
+                suffixes=suffixes,
+                labels=tuple(t.label for t in self.tags),
+                locations=tuple(t.location for t in self.tags),
+                suffix_set=frozenset(suffixes)
+            )
+        return self._columns
+    
+    def _invalidate_columns(self):
+        """Drop the cached columns; call after any change to tags or their fields."""
+        self._columns = None
+    
     @property
     def suffixes(self) -> List[str]:
         """Get list of all tag suffixes."""
-        return [t.suffix for t in self.tags]
+        return list(self.columns.suffixes)
+    
+    @property
+    def suffix_set(self) -> FrozenSet[str]:
+        """Get tag suffixes as a frozenset for membership tests and set ops."""
+        return self.columns.suffix_set
     
     @property
     def labels(self) -> List[str]:
         """Get list of all tag labels."""
-        return [t.label for t in self.tags]
+        return list(self.columns.labels)
     
     @property
     def locations(self) -> List[str]:
         """Get list of all tag locations."""
-        return [t.location for t in self.tags]
+        return list(self.columns.locations)
     
     @property 
     def count(self) -> int:
@@ -88,6 +124,7 @@ class TagManager:
                 )
                 if tag.suffix:
                     self.tags.append(tag)
+            self._invalidate_columns()
             
             # Parse antenna settings
             self.antenna_settings = data.get("antenna_settings", {})
@@ -191,6 +228,32 @@ class TagManager:
             label=label.strip(),
             location=location.strip()
         ))
+        self._invalidate_columns()
+        return True
+    
+    def update_tag(
+        self,
+        suffix: str,
+        label: Optional[str] = None,
+        location: Optional[str] = None
+    ) -> bool:
+        """
+        Change the label and/or location of an existing tag.
+        
+        Use this instead of editing Tag fields directly so the cached
+        label/location columns are rebuilt.
+        
+        Returns:
+            True if updated (False if suffix not found)
+        """
+        tag = self.find_tag_by_suffix(suffix)
+        if not tag:
+            return False
+        if label is not None:
+            tag.label = label.strip()
+        if location is not None:
+            tag.location = location.strip()
+        self._invalidate_columns()
         return True
     
     def remove_tag(self, suffix: str) -> bool:
@@ -203,6 +266,7 @@ class TagManager:
         tag = self.find_tag_by_suffix(suffix)
         if tag:
             self.tags.remove(tag)
+            self._invalidate_columns()
             return True
         return False
     
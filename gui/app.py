@@ -79,8 +79,8 @@ class MeasurementApp:
         self.tag_manager = TagManager(self.settings.tag_config_file)
         
         # Initialize utilities
-        self.exporter = CSVExporter()
         self.logger = Logger()
+        self.exporter = CSVExporter(logger=self.logger)
         
         # Initialize protocols
         if self.reader:
@@ -124,6 +124,9 @@ class MeasurementApp:
         # Build UI
         self._build_ui()
         
+        # Show logger messages (exporter status/fallbacks) in the log panel
+        self.logger.set_callback(self._on_log_message)
+        
         # Setup keyboard shortcuts
         self._setup_keyboard_shortcuts()
         
@@ -377,7 +380,7 @@ class MeasurementApp:
                 inventory = self.reader.get_all_data()
                 self.rssi_graph.update_from_inventory(
                     inventory, 
-                    self.tag_manager.suffixes
+                    self.tag_manager.suffix_set
                 )
                 self.rssi_graph.refresh()
                 
@@ -410,6 +413,10 @@ class MeasurementApp:
         self.export_tab.log("Reader disconnected")
         self.led_reader.set_state("off")
     
+    def _on_log_message(self, line: str):
+        """Forward a Logger line to the log panel (may run on worker threads)."""
+        self.root.after(0, self.export_tab.log_line, line)
+    
     def _on_angle_changed(self, angle: float):
         """Handle beam angle change."""
         self.status_bar.set_status(f"Beam: {angle:.1f}°", "info")
@@ -443,7 +450,6 @@ class MeasurementApp:
                 v_ch1=v1,
                 v_ch2=v2
             )
-            self.export_tab.log(f"Exported: {path}")
             messagebox.showinfo("Export", f"Saved: {path}")
         except Exception as e:
             messagebox.showerror("Export", str(e))
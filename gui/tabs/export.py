@@ -95,6 +95,11 @@ class ExportTab(ttk.Frame):
         self.txt_log.insert(tk.END, line)
         self.txt_log.see(tk.END)
     
+    def log_line(self, line: str):
+        """Add an already timestamped Logger line to log display."""
+        self.txt_log.insert(tk.END, line + "\n")
+        self.txt_log.see(tk.END)
+    
     def _clear_log(self):
         """Clear log display."""
         self.txt_log.delete("1.0", tk.END)
@@ -125,7 +130,6 @@ class ExportTab(ttk.Frame):
                 filename=filename.split("/")[-1].split("\\")[-1],
                 **self._beam_info
             )
-            self.log(f"Exported snapshot: {path}")
             messagebox.showinfo("Export", f"Saved: {path}")
         except Exception as e:
             messagebox.showerror("Export", str(e))
@@ -150,7 +154,6 @@ class ExportTab(ttk.Frame):
                 self._current_result,
                 filename=filename.split("/")[-1].split("\\")[-1]
             )
-            self.log(f"Exported protocol: {path}")
             messagebox.showinfo("Export", f"Saved: {path}")
         except Exception as e:
             messagebox.showerror("Export", str(e))
@@ -227,10 +227,11 @@ class LiveMonitorTab(ttk.Frame):
             rssi_vals = []
             total_reads = 0
             tags_seen = 0
+            suffix_set = self.tag_manager.suffix_set
             
             for epc, info in inv.items():
                 suffix = epc[-4:] if len(epc) >= 4 else ""
-                if suffix in self.tag_manager.suffixes:
+                if suffix in suffix_set:
                     rssi_vals.append(info.get("rssi", -99))
                     total_reads += info.get("count", 0)
                     tags_seen += 1
@@ -300,11 +301,12 @@ class LiveMonitorTab(ttk.Frame):
             reverse=True
         )
         
+        suffix_set = self.tag_manager.suffix_set
         for epc, data in items:
             age = now - data.get("seen_time", now)
             if age <= 5.0:
                 suffix = epc[-4:] if len(epc) >= 4 else epc
-                is_known = suffix in self.tag_manager.suffixes
+                is_known = suffix in suffix_set
                 
                 self.tree_all.insert(
                     "", tk.END,
@@ -17,6 +17,9 @@ class ProtocolRunnerTab(ttk.Frame):
     Switches between L-C-R sweep (for Ant1 or Both) and Simple Inventory (for Ant2 only).
     """
     
+    # Union rows kept in the results table; older rows are evicted
+    MAX_RESULT_ROWS = 250
+    
     def __init__(
         self,
         parent,
@@ -309,6 +312,10 @@ class ProtocolRunnerTab(ttk.Frame):
         def worker():
             exported_files = []
             subfolder = None
+            # Ant1 export runs alongside the Ant2 phase (reader reconnects
+            # and dwell waits), joined before Ant2 is exported
+            export1_thread = None
+            export1_errors = []
             
             try:
                 # Create subfolder for this run: PhasedArray_{RefName}
@@ -356,9 +363,17 @@ class ProtocolRunnerTab(ttk.Frame):
                     from datetime import datetime
                     timestamp = datetime.now().strftime("%H%M%S")
                     filepath1 = subfolder / f"PhasedArray_LCR_{timestamp}.csv"
-                    # Use export_to_path for absolute path (no output_dir prepend)
-                    self.csv_exporter.export_to_path(result_ant1, filepath1)
-                    exported_files.append(str(filepath1))
+                    
+                    def export_ant1():
+                        try:
+                            # Use export_to_path for absolute path (no output_dir prepend)
+                            self.csv_exporter.export_to_path(result_ant1, filepath1)
+                            exported_files.append(str(filepath1))
+                        except Exception as e:
+                            export1_errors.append(e)
+                    
+                    export1_thread = threading.Thread(target=export_ant1, daemon=True)
+                    export1_thread.start()
                 
                 # Phase 2: Reconfigure reader for Ant2
                 self.after(0, lambda: self.lbl_progress.config(text="[1.5/2] Reconfiguring for Ant2..."))
@@ -397,6 +412,12 @@ class ProtocolRunnerTab(ttk.Frame):
                 else:
                     self.after(0, lambda: messagebox.showerror("Phase 2 Error", result_ant2.error_message))
                 
+                # Ant1 file must be complete before reporting success
+                if export1_thread is not None:
+                    export1_thread.join()
+                    if export1_errors:
+                        raise export1_errors.pop()
+                
                 # Auto-export Ant2 result
                 if self.csv_exporter and subfolder:
                     from datetime import datetime
@@ -429,20 +450,28 @@ class ProtocolRunnerTab(ttk.Frame):
             except Exception as e:
                 import traceback
                 traceback.print_exc()
-                self.after(0, lambda: messagebox.showerror("Error", str(e)))
+                self.after(0, lambda msg=str(e): messagebox.showerror("Error", msg))
                 self.after(0, lambda: self.lbl_progress.config(text="Failed"))
             
             finally:
+                # Don't re-enable Run while the Ant1 file is still being written
+                if export1_thread is not None:
+                    export1_thread.join()
+                    # Set only if phase 2 failed before the export was checked
+                    if export1_errors:
+                        export1_error = export1_errors.pop()
+                        self.after(0, lambda: messagebox.showerror("Ant1 Export Error", str(export1_error)))
                 self.after(0, lambda: self.btn_run.config(state=tk.NORMAL))
         
         threading.Thread(target=worker, daemon=True).start()
     
     def _display_result(self, result):
-        """Display protocol result in table."""
+        """Append protocol result rows to the table, evicting the oldest past MAX_RESULT_ROWS."""
+        station, ref = result.station_name, result.ref_antenna_name
         for union in result.union_results:
             self.tree_results.insert("", tk.END, values=(
-                result.station_name,
-                result.ref_antenna_name,
+                station,
+                ref,
                 union.repeat,
                 union.port_config,
                 union.dwell_s,
@@ -453,6 +482,11 @@ class ProtocolRunnerTab(ttk.Frame):
                 "|".join(union.ant1_missed[:3]),
                 "|".join(union.ant2_missed[:3])
             ))
+        
+        children = self.tree_results.get_children()
+        overflow = len(children) - self.MAX_RESULT_ROWS
+        if overflow > 0:
+            self.tree_results.delete(*children[:overflow])
     
     def _clear_results(self):
         """Clear all results."""
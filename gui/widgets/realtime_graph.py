@@ -9,6 +9,7 @@ from tkinter import ttk
 from collections import deque
 from datetime import datetime
 import time
+from typing import Collection
 
 # Try to import matplotlib
 try:
@@ -136,13 +137,13 @@ class RealTimeGraph(ttk.Frame):
         
         self._data[tag_suffix].append((now, rssi))
     
-    def update_from_inventory(self, inventory: dict, tag_suffixes: list):
+    def update_from_inventory(self, inventory: dict, tag_suffixes: Collection[str]):
         """
         Update graph from inventory data.
         
         Args:
             inventory: Current reader inventory
-            tag_suffixes: List of tag suffixes to track
+            tag_suffixes: Tag suffixes to track (a set keeps lookups O(1))
         """
         if not MATPLOTLIB_AVAILABLE:
             return
@@ -43,9 +43,14 @@ import numpy as np
 import pandas as pd
 from scipy.interpolate import interp1d
 import csv
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from operator import attrgetter
 from datetime import datetime
 import threading
 import os
+import shutil
+import tempfile
 
 # Optional plotting
 try:
@@ -77,6 +82,150 @@ except ImportError:
     SLLURP_AVAILABLE = False
 
 
+# Protocol tab: maximum rows shown in the union summary table
+UNION_TABLE_MAX_ROWS = 250
+
+# Per-step constant columns followed by per-tag columns of a TAGSTEP record
+TAGSTEP_STEP_COLUMNS = (
+    "record_type", "timestamp", "station", "ref_antenna_name", "repeat",
+    "beam_state", "port_config", "angle_deg", "dwell_s", "active_antennas",
+)
+TAGSTEP_TAG_COLUMNS = (
+    "tag_label", "tag_suffix", "tag_location",
+    "ant1_seen", "ant1_rssi", "ant1_count",
+    "ant2_seen", "ant2_rssi", "ant2_count",
+)
+
+# STEP headers - all fields including new RSSI stats
+STEP_HEADERS = [
+    "record_type", "timestamp", "station", "ref_antenna_name", "repeat",
+    "beam_state", "port_config", "angle_deg", "v_ch1", "v_ch2", "dwell_s",
+    "active_antennas", "tags_total",
+    "ant1_unique_epc_n", "ant2_unique_epc_n", 
+    "ant1_targets_seen_n", "ant2_targets_seen_n",
+    "ant1_total_reads_targets", "ant1_rssi_min_targets", "ant1_rssi_max_targets", "ant1_rssi_avg_targets",
+    "ant2_total_reads_targets", "ant2_rssi_min_targets", "ant2_rssi_max_targets", "ant2_rssi_avg_targets",
+    "ant1_missed_suffixes", "ant1_missed_labels", "ant1_missed_locations",
+    "ant2_missed_suffixes", "ant2_missed_labels", "ant2_missed_locations",
+    # Simple inventory fields (for SIMPLE_INV records)
+    "tags_seen", "total_reads", "rssi_min", "rssi_max", "rssi_avg"
+]
+
+# TAGSTEP headers - clean version
+TAGSTEP_HEADERS = [
+    "record_type", "timestamp", "station", "ref_antenna_name", "repeat",
+    "beam_state", "port_config", "angle_deg", "dwell_s",
+    "active_antennas",
+    "tag_label", "tag_suffix", "tag_location",
+    "ant1_seen", "ant1_rssi", "ant1_count",
+    "ant2_seen", "ant2_rssi", "ant2_count",
+    # Simple tag fields (for SIMPLE_TAG records)
+    "seen", "rssi", "count", "phase"
+]
+
+# UNION headers - with best beam per tag
+UNION_HEADERS = [
+    "record_type", "timestamp", "station", "ref_antenna_name", "repeat",
+    "port_config", "dwell_s", "active_antennas", "tags_total",
+    "union_ant1_unique_epc_n", "union_ant2_unique_epc_n",
+    "union_ant1_targets_seen_n", "union_ant2_targets_seen_n",
+    "ant1_missed_suffixes", "ant1_missed_labels", "ant1_missed_locations",
+    "ant2_missed_suffixes", "ant2_missed_labels", "ant2_missed_locations",
+    "ant1_best_beam_per_tag", "ant1_best_rssi_per_tag",
+    "ant2_best_beam_per_tag", "ant2_best_rssi_per_tag",
+    "ant2_health"
+]
+
+# Row records: field order matches the CSV headers, missing fields are ""
+StepRow = namedtuple("StepRow", STEP_HEADERS, defaults=("",) * len(STEP_HEADERS))
+TagStepRow = namedtuple("TagStepRow", TAGSTEP_HEADERS, defaults=("",) * len(TAGSTEP_HEADERS))
+_UNION_FIELDS = UNION_HEADERS + [
+    # SIMPLE_UNION display-only fields (not exported)
+    "union_ant1_missed_targets", "union_ant2_missed_targets",
+]
+UnionRow = namedtuple("UnionRow", _UNION_FIELDS, defaults=("",) * len(_UNION_FIELDS))
+
+# Columns of the live-monitor snapshot export
+LIVE_SNAPSHOT_HEADERS = [
+    "timestamp", "epc", "suffix", "count", "rssi", "phase", "doppler", "antenna",
+    "port_config", "angle_deg", "v_ch1", "v_ch2",
+]
+
+# RUN_METADATA block of the protocol CSV export, in written order
+RunMetadata = namedtuple("RunMetadata", [
+    "run_id", "export_time", "software_version", "station",
+    "reader_ip", "reader_connected", "tx_power_dbm", "mcu_port", "mcu_connected",
+    "active_antennas", "antenna_mode", "port2_enabled",
+    "protocol_dwell_s", "protocol_repeats", "port_config", "beam_sequence",
+    "lut_file", "total_tags_configured", "tag_suffixes",
+])
+
+# Log panel: flush interval and maximum number of queued, unflushed lines
+LOG_FLUSH_MS = 100
+LOG_QUEUE_MAX = 5000
+
+# Buffer size used when streaming protocol exports to disk
+EXPORT_BUFFER_SIZE = 4 << 20
+
+# UnionRow -> union summary table values, in column order
+_union_table_values = attrgetter(
+    "station", "ref_antenna_name", "repeat", "port_config", "dwell_s",
+    "union_ant1_targets_seen_n", "union_ant2_targets_seen_n",
+    "union_ant1_unique_epc_n", "union_ant2_unique_epc_n",
+    "union_ant1_missed_targets", "union_ant2_missed_targets",
+)
+
+
+class RowSpool:
+    """
+    Disk-backed, append-only store for protocol rows with a fixed header.
+
+    Rows are written to an anonymous temporary file as they are produced, so
+    memory stays flat over long runs; copy_to() replays them on export.
+    Rows appended after close() (results cleared mid-run) are discarded.
+    """
+
+    def __init__(self, headers):
+        self.headers = tuple(headers)
+        self._file = tempfile.TemporaryFile("w+", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._n = 0
+        self._lock = threading.Lock()  # protocol worker writes, UI thread exports
+
+    def __len__(self):
+        return self._n
+
+    def append(self, row):
+        """Append one row whose values are already in header order."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._writer.writerow(row)
+            self._n += 1
+
+    def extend_columns(self, cols: dict, n: int):
+        """Append n rows given as {column: list_of_n_values}."""
+        blank = [""] * n
+        with self._lock:
+            if self._file.closed:
+                return
+            self._writer.writerows(zip(*[cols.get(h, blank) for h in self.headers]))
+            self._n += n
+
+    def copy_to(self, f):
+        """Write all spooled rows (without header) to text file f."""
+        with self._lock:
+            self._file.flush()
+            self._file.seek(0)
+            shutil.copyfileobj(self._file, f, EXPORT_BUFFER_SIZE)
+            self._file.seek(0, os.SEEK_END)
+
+    def close(self):
+        # Wait for a running copy_to (export worker) to finish first
+        with self._lock:
+            self._file.close()
+
+
 # =============================================================================
 # 1) CORRECTED LUT ENGINE
 # =============================================================================
@@ -90,6 +239,8 @@ class CorrectedBeamLUT:
         self.config_0 = pd.DataFrame()
         self.config_1 = pd.DataFrame()
         self.interp = {0: {}, 1: {}}
+        # (config, angle) -> (V_CH1, V_CH2); beam angles repeat every sweep step
+        self._voltage_cache = {}
 
         try:
             if not os.path.exists(csv_path):
@@ -134,6 +285,11 @@ class CorrectedBeamLUT:
         if config not in self.interp or not self.interp[config]:
             return 0.0, 0.0
 
+        key = (config, float(target_angle))
+        cached = self._voltage_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
             v1 = float(self.interp[config]["V_CH1"](target_angle))
             v2 = float(self.interp[config]["V_CH2"](target_angle))
@@ -141,6 +297,9 @@ class CorrectedBeamLUT:
             # Clamp to valid range used by your phase-shifter control
             v1 = max(0.0, min(8.5, v1))
             v2 = max(0.0, min(8.5, v2))
+            if len(self._voltage_cache) >= 256:  # slider drags produce arbitrary angles
+                self._voltage_cache.clear()
+            self._voltage_cache[key] = (v1, v2)
             return v1, v2
         except Exception as e:
             print(f"Interpolation error: {e}")
@@ -150,7 +309,7 @@ class CorrectedBeamLUT:
         config_df = self.config_0 if port_config == 0 else self.config_1
         if config_df.empty:
             return []
-        return sorted(config_df["Angle_Cmd_Deg"].unique().tolist())
+        return np.sort(config_df["Angle_Cmd_Deg"].unique()).tolist()
 
     def get_beam_presets(self, port_config: int) -> dict:
         """Returns LEFT/CENTER/RIGHT angle presets from LUT coverage."""
@@ -170,6 +329,7 @@ class CorrectedBeamLUT:
 class LLRPReader:
     def __init__(self):
         self.inventory = {}
+        self.inventory_by_antenna = {1: {}, 2: {}}  # same records, split at arrival
         self.connected = False
         self.inventory_running = False
         self.reader_client = None
@@ -297,6 +457,11 @@ class LLRPReader:
                 else:
                     epc = str(epc_raw).upper()
 
+                # Consumers slice epc[-4:] unconditionally; pad short EPCs with a
+                # non-hex sentinel so they can never match a configured suffix.
+                if len(epc) < 4:
+                    epc = epc.rjust(4, "_")
+
                 rssi = float(tag.get("ImpinjPeakRSSI", tag.get("PeakRSSI", -90)))
                 if rssi < -150:
                     rssi = rssi / 100.0
@@ -321,13 +486,18 @@ class LLRPReader:
                     phase = 0.0
 
                 ant_id = tag.get("AntennaID", 1)
+                try:
+                    ant_key = 2 if int(ant_id) == 2 else 1
+                except Exception:
+                    ant_key = 1
                 timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
 
                 with self.lock:
                     prev = self.inventory.get(epc, {"count": 0})
                     count = prev["count"] + 1
-                    self.inventory[epc] = {
+                    record = {
                         "epc": epc,
+                        "suffix": epc[-4:],
                         "rssi": rssi,
                         "phase": phase,
                         "doppler": doppler,
@@ -336,6 +506,10 @@ class LLRPReader:
                         "seen_time": time.time(),
                         "antenna": ant_id,
                     }
+                    self.inventory[epc] = record
+                    # An EPC belongs to the antenna that reported it last
+                    self.inventory_by_antenna[3 - ant_key].pop(epc, None)
+                    self.inventory_by_antenna[ant_key][epc] = record
             except Exception:
                 pass
 
@@ -343,9 +517,15 @@ class LLRPReader:
         with self.lock:
             return self.inventory.copy()
 
+    def get_data_by_antenna(self):
+        """Return (ant1_inventory, ant2_inventory) split as reports arrived."""
+        with self.lock:
+            return self.inventory_by_antenna[1].copy(), self.inventory_by_antenna[2].copy()
+
     def clear_data(self):
         with self.lock:
             self.inventory = {}
+            self.inventory_by_antenna = {1: {}, 2: {}}
 
 
 # =============================================================================
@@ -361,6 +541,10 @@ class CalibV4GUI:
         self.reader = LLRPReader() if SLLURP_AVAILABLE else None
         self.serial = None
 
+        # Log lines queued by _log (from any thread), written out by _flush_log
+        self._log_queue = deque(maxlen=LOG_QUEUE_MAX)
+        self._log_timer = None
+
         # State
         self.current_port_config = 0
         self.current_angle = 0.0
@@ -377,21 +561,23 @@ class CalibV4GUI:
         
         # Antenna Mode: "BOTH", "ANT1_ONLY", "ANT2_ONLY"
         self.antenna_mode = tk.StringVar(value="BOTH")
-        self.current_antennas = [1, 2]  # tracks active antenna list
+        self._set_current_antennas([1, 2])  # tracks active antenna list
         
         # Load tag config (may modify port_2_enabled)
         self.load_tag_config()
 
         # Protocol storage
-        self.afsuam_step_rows = []        # STEP_ROWS
-        self.afsuam_tagstep_rows = []     # TAGSTEP_ROWS (per-tag, per-step detail)
-        self.afsuam_union_rows = []       # UNION_ROWS
+        self.afsuam_step_rows = RowSpool(STEP_HEADERS)        # STEP_ROWS
+        self.afsuam_tagstep_rows = RowSpool(TAGSTEP_HEADERS)  # TAGSTEP_ROWS (per-tag, per-step detail)
+        self.afsuam_union_rows = []                           # UNION_ROWS
+        self._union_table_total = 0                           # union rows already in tree_union
 
         self.update_timer = None
 
         self._setup_styles()
         self._setup_ui()
         self._start_update_loop()
+        self._flush_log()
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
@@ -429,6 +615,12 @@ class CalibV4GUI:
         if len(self.tag_locations) != n:
             self.tag_locations = (self.tag_locations + [""] * n)[:n]
 
+        self._tag_suffix_set = frozenset(self.tag_suffixes)
+        self._tag_suffixes_joined = "|".join(self.tag_suffixes)
+        # reversed so a duplicated suffix keeps its first label, as list.index did
+        self._suffix_to_label = dict(zip(reversed(self.tag_suffixes), reversed(self.tag_labels)))
+        self._suffix_to_location = dict(zip(reversed(self.tag_suffixes), reversed(self.tag_locations)))
+
     # ------------------------------
     # Serial port preference
     # ------------------------------
@@ -898,7 +1090,7 @@ class CalibV4GUI:
         else:  # BOTH
             antennas = [1, 2]
         
-        self.current_antennas = antennas
+        self._set_current_antennas(antennas)
 
         ok = self.reader.connect(ip, pwr, antennas=antennas)
         if ok:
@@ -917,6 +1109,13 @@ class CalibV4GUI:
         self.btn_disconnect.config(state=tk.DISABLED)
         self._log("Reader disconnected.")
 
+    def _set_current_antennas(self, antennas):
+        """Set the active antenna list and refresh the cached flags/strings derived from it."""
+        self.current_antennas = antennas
+        self._ant1_active = 1 in antennas
+        self._ant2_active = 2 in antennas
+        self._active_ants_str = "|".join(map(str, antennas))
+
     def _update_antenna_status_label(self):
         """Update the antenna status label based on current_antennas."""
         if self.current_antennas == [1]:
@@ -965,7 +1164,7 @@ class CalibV4GUI:
             time.sleep(2.0)  # Wait for clean disconnect
 
         # Update antennas
-        self.current_antennas = new_antennas
+        self._set_current_antennas(new_antennas)
         self._update_antenna_status_label()
 
         # Reconnect with new config
@@ -1039,117 +1238,147 @@ class CalibV4GUI:
     # Live monitor update loop
     # =============================================================================
     def _start_update_loop(self):
+        # The worker computes snapshots off the Tk thread and leaves the newest
+        # one in a single-slot latch; the UI tick only applies it to widgets.
+        self._live_snapshot = None
+        self._live_snapshot_lock = threading.Lock()
+        self._live_worker_stop = threading.Event()
+        threading.Thread(target=self._live_monitor_worker, daemon=True).start()
         self.update_live_monitor()
 
+    def _live_monitor_worker(self):
+        while not self._live_worker_stop.wait(0.25):
+            try:
+                snap = self._compute_live_snapshot()
+            except Exception:
+                continue
+            if snap is not None:
+                with self._live_snapshot_lock:
+                    self._live_snapshot = snap  # older unapplied snapshot is dropped
+
     def update_live_monitor(self):
-        try:
-            if self.reader and self.reader.connected:
-                inv = self.reader.get_all_data()
-                now = time.time()
-
-                # Split inventory by antenna
-                inv1, inv2 = self._split_inventory_by_antenna(inv)
-
-                # ==================== ANTENNA 1 PANEL ====================
-                self.tree_ant1.delete(*self.tree_ant1.get_children())
-                for label, suffix, loc in zip(self.tag_labels, self.tag_suffixes, self.tag_locations):
-                    info = None
-                    for epc, d in inv1.items():
-                        if epc.endswith(suffix):
-                            info = d
-                            break
-                    if info is None:
-                        self.tree_ant1.insert("", tk.END, values=(label, loc, suffix, 0, "-", "-"))
-                    else:
-                        self.tree_ant1.insert(
-                            "", tk.END,
-                            values=(
-                                label, loc, suffix,
-                                info.get("count", 0),
-                                f"{info.get('rssi', -99.0):.1f}",
-                                f"{info.get('phase', 0.0):.0f}",
-                            )
-                        )
+        with self._live_snapshot_lock:
+            snap, self._live_snapshot = self._live_snapshot, None
+        if snap is not None:
+            try:
+                self._apply_live_snapshot(snap)
+            except Exception:
+                pass
 
-                # ==================== ANTENNA 2 PANEL ====================
-                self.tree_ant2.delete(*self.tree_ant2.get_children())
-                for label, suffix, loc in zip(self.tag_labels, self.tag_suffixes, self.tag_locations):
-                    info = None
-                    for epc, d in inv2.items():
-                        if epc.endswith(suffix):
-                            info = d
-                            break
-                    if info is None:
-                        self.tree_ant2.insert("", tk.END, values=(label, loc, suffix, 0, "-", "-"))
-                    else:
-                        self.tree_ant2.insert(
-                            "", tk.END,
-                            values=(
-                                label, loc, suffix,
-                                info.get("count", 0),
-                                f"{info.get('rssi', -99.0):.1f}",
-                                f"{info.get('phase', 0.0):.0f}",
-                            )
-                        )
+        self.update_timer = self.root.after(250, self.update_live_monitor)
 
-                # ==================== CALCULATE STATISTICS ====================
-                self._update_antenna_statistics(inv1, inv2)
-
-                # ==================== COMBINED TARGETS ====================
-                self.tree_targets.delete(*self.tree_targets.get_children())
-                for label, suffix, loc in zip(self.tag_labels, self.tag_suffixes, self.tag_locations):
-                    info = None
-                    for epc, d in inv.items():
-                        if epc.endswith(suffix):
-                            info = d
-                            break
-                    if info is None:
-                        self.tree_targets.insert("", tk.END, values=(label, loc, suffix, 0, "-99.0", "0", "0.0", "-"))
-                    else:
-                        self.tree_targets.insert(
-                            "", tk.END,
-                            values=(
-                                label, loc, suffix,
-                                info.get("count", 0),
-                                f"{info.get('rssi', -99.0):.1f}",
-                                f"{info.get('phase', 0.0):.0f}",
-                                f"{info.get('doppler', 0.0):.1f}",
-                                info.get("antenna", 1),
-                            )
-                        )
+    def _compute_live_snapshot(self):
+        """Build all live-monitor rows and stats texts (no Tk calls)."""
+        if not (self.reader and self.reader.connected):
+            return None
 
-                # ==================== ALL TAGS (recent 5s) ====================
-                self.tree_all.delete(*self.tree_all.get_children())
-                items = sorted(inv.items(), key=lambda x: x[1].get("rssi", -99), reverse=True)
-                for epc, d in items:
-                    age = now - d.get("seen_time", now)
-                    if age <= 5.0:
-                        suffix = epc[-4:] if len(epc) >= 4 else epc
-                        is_known = suffix in self.tag_suffixes
-                        tag_type = "KNOWN" if is_known else "UNKNOWN"
-                        tag_style = "known" if is_known else "unknown"
-                        
-                        self.tree_all.insert(
-                            "", tk.END,
-                            values=(
-                                suffix,
-                                tag_type,
-                                epc,
-                                f"{d.get('rssi', -99.0):.1f}",
-                                f"{d.get('phase', 0.0):.0f}",
-                                d.get("count", 0),
-                                d.get("antenna", 1),
-                                d.get("timestamp", ""),
-                            ),
-                            tags=(tag_style,)
-                        )
-        except Exception:
-            pass
+        inv = self.reader.get_all_data()
+        now = time.time()
 
-        self.update_timer = self.root.after(250, self.update_live_monitor)
+        # Split inventory by antenna
+        inv1, inv2 = self._split_inventory_by_antenna(inv)
+
+        # ==================== ALL TAGS (recent 5s) ====================
+        # Filter by age before sorting so stale tags never reach the sort.
+        # Rows are listed weakest-first for insertion at index 0 so the
+        # strongest tag ends up on top; prepending is cheaper in Tk.
+        fresh = [(epc, d) for epc, d in inv.items() if now - d.get("seen_time", now) <= 5.0]
+        fresh.sort(key=lambda x: x[1].get("rssi", -99))
+        known = self._tag_suffix_set
+        all_rows = []
+        for epc, d in fresh:
+            suffix = epc[-4:]
+            is_known = suffix in known
+            all_rows.append((
+                (
+                    suffix,
+                    "KNOWN" if is_known else "UNKNOWN",
+                    epc,
+                    f"{d.get('rssi', -99.0):.1f}",
+                    f"{d.get('phase', 0.0):.0f}",
+                    d.get("count", 0),
+                    d.get("antenna", 1),
+                    d.get("timestamp", ""),
+                ),
+                "known" if is_known else "unknown",
+            ))
+
+        return {
+            "ant1_rows": self._tag_tree_rows(self._index_by_suffix(inv1), False),
+            "ant2_rows": self._tag_tree_rows(self._index_by_suffix(inv2), False),
+            "targets_rows": self._tag_tree_rows(self._index_by_suffix(inv), True),
+            "all_rows": all_rows,
+            "stats": self._antenna_statistics_text(inv1, inv2),
+        }
 
-    def _update_antenna_statistics(self, inv1: dict, inv2: dict):
-        """Calculate and update statistics for both antennas with mode awareness."""
+    def _apply_live_snapshot(self, snap: dict):
+        """Push a computed snapshot into the live-monitor widgets (Tk thread only)."""
+        trees = (self.tree_ant1, self.tree_ant2, self.tree_targets, self.tree_all)
+        with self._batch_tree_update(*trees):
+            for tree, key in ((self.tree_ant1, "ant1_rows"),
+                              (self.tree_ant2, "ant2_rows"),
+                              (self.tree_targets, "targets_rows")):
+                for values in snap[key]:
+                    tree.insert("", tk.END, values=values)
+            for values, tag_style in snap["all_rows"]:
+                self.tree_all.insert("", 0, values=values, tags=(tag_style,))
+
+        txt1, txt2 = snap["stats"]
+        if hasattr(self, 'lbl_ant1_stats'):
+            self.lbl_ant1_stats.config(text=txt1)
+        if hasattr(self, 'lbl_ant2_stats'):
+            self.lbl_ant2_stats.config(text=txt2)
+
+    @staticmethod
+    def _index_by_suffix(inv: dict) -> dict:
+        """Map 4-char suffix -> info for an inventory (first EPC per suffix wins)."""
+        idx = {}
+        for epc, info in inv.items():
+            idx.setdefault(epc[-4:], info)
+        return idx
+
+    def _tag_tree_rows(self, inv_index: dict, include_doppler_antenna: bool) -> list:
+        """One row per configured tag; the combined view adds doppler/antenna."""
+        rows = []
+        for label, suffix, loc in zip(self.tag_labels, self.tag_suffixes, self.tag_locations):
+            info = inv_index.get(suffix)
+            if info is None:
+                if include_doppler_antenna:
+                    values = (label, loc, suffix, 0, "-99.0", "0", "0.0", "-")
+                else:
+                    values = (label, loc, suffix, 0, "-", "-")
+            else:
+                values = (
+                    label, loc, suffix,
+                    info.get("count", 0),
+                    f"{info.get('rssi', -99.0):.1f}",
+                    f"{info.get('phase', 0.0):.0f}",
+                )
+                if include_doppler_antenna:
+                    values += (f"{info.get('doppler', 0.0):.1f}", info.get("antenna", 1))
+            rows.append(values)
+        return rows
+
+    @contextmanager
+    def _batch_tree_update(self, *trees):
+        """
+        Clear trees and detach their scrollbars while the caller refills them,
+        so each scrollbar is updated once instead of once per inserted row.
+        """
+        saved = []
+        for tree in trees:
+            saved.append((tree, tree.cget("yscrollcommand"), tree.yview()[0]))
+            tree.configure(yscrollcommand="")
+            tree.delete(*tree.get_children())
+        try:
+            yield
+        finally:
+            for tree, yscroll, top in saved:
+                tree.configure(yscrollcommand=yscroll)
+                tree.yview_moveto(top)
+
+    def _antenna_statistics_text(self, inv1: dict, inv2: dict) -> tuple:
+        """Calculate statistics for both antennas and format them with mode awareness."""
         # Helper to get stats for target tags in an inventory
         def calc_stats(inv: dict):
             rssi_vals = []
@@ -1161,7 +1390,7 @@ class CalibV4GUI:
             known_suffixes_found = set()
             
             for epc, info in inv.items():
-                suffix = epc[-4:] if len(epc) >= 4 else ""
+                suffix = epc[-4:]
                 if suffix in self.tag_suffixes:
                     known_suffixes_found.add(suffix)
                     rssi = info.get("rssi", -99.0)
@@ -1194,20 +1423,17 @@ class CalibV4GUI:
         total_tags = len(self.tag_suffixes)
         
         # Format text based on active antenna mode
-        if 1 in self.current_antennas:
+        if self._ant1_active:
             txt1 = f"📊 Tags: {stats1['tags']}/{total_tags} | RSSI: {stats1['min']}/{stats1['max']}/{stats1['avg']} | Reads: {stats1['reads']} | Unknown: {stats1['unknown']}"
         else:
             txt1 = "⚫ DEVRE DIŞI (Sadece Ant2 aktif)"
         
-        if 2 in self.current_antennas:
+        if self._ant2_active:
             txt2 = f"📊 Tags: {stats2['tags']}/{total_tags} | RSSI: {stats2['min']}/{stats2['max']}/{stats2['avg']} | Reads: {stats2['reads']} | Unknown: {stats2['unknown']}"
         else:
             txt2 = "⚫ DEVRE DIŞI (Sadece Ant1 aktif)"
         
-        if hasattr(self, 'lbl_ant1_stats'):
-            self.lbl_ant1_stats.config(text=txt1)
-        if hasattr(self, 'lbl_ant2_stats'):
-            self.lbl_ant2_stats.config(text=txt2)
+        return txt1, txt2
 
     # =============================================================================
     # AFSUAM Protocol helpers
@@ -1215,31 +1441,11 @@ class CalibV4GUI:
     def _split_inventory_by_antenna(self, inventory: dict):
         inv1, inv2 = {}, {}
         for epc, info in inventory.items():
-            try:
-                ant = int(info.get("antenna", 1))
-            except Exception:
-                ant = 1
-            if ant == 2:
-                inv2[epc] = info
-            else:
-                inv1[epc] = info
+            # Readers report ints; accept "2" too, anything else is antenna 1
+            ant = info.get("antenna", 1)
+            (inv2 if ant == 2 or ant == "2" else inv1)[epc] = info
         return inv1, inv2
 
-    def _find_tag_info_by_suffix(self, inv: dict, suffix: str):
-        """
-        Returns dict with: seen(bool), epc(str|""), rssi(float|None), count(int|0)
-        inv is per-antenna inventory (epc -> info).
-        """
-        for epc, info in inv.items():
-            if epc.endswith(suffix):
-                return {
-                    "seen": True,
-                    "epc": epc,
-                    "rssi": float(info.get("rssi", -99.0)),
-                    "count": int(info.get("count", 0)),
-                }
-        return {"seen": False, "epc": "", "rssi": None, "count": 0}
-
     def _collect_step(self, step_name: str, dwell_s: float, angle_deg: float, port_config: int,
                       station: str, ref_name: str, repeat_idx: int):
         # Apply beam state (Port1)
@@ -1251,39 +1457,75 @@ class CalibV4GUI:
 
         time.sleep(0.8)
 
+        # The reader splits reports per antenna as they arrive, so no
+        # end-of-dwell pass over the whole inventory is needed here.
         self.reader.clear_data()
         time.sleep(dwell_s)
-        inv = self.reader.get_all_data()
-
-        inv1, inv2 = self._split_inventory_by_antenna(inv)
+        inv1, inv2 = self.reader.get_data_by_antenna()
 
         # step coverage sets
         ant1_epcs = set(inv1.keys())
         ant2_epcs = set(inv2.keys())
 
+        # Index each antenna's inventory by suffix (first EPC per suffix wins)
+        idx1, idx2 = {}, {}
+        for info in inv1.values():
+            idx1.setdefault(info["suffix"], info)
+        for info in inv2.values():
+            idx2.setdefault(info["suffix"], info)
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        active_ants_str = self._active_ants_str
+
+        # Per-tag per-step detail (TAGSTEP), built column-wise
+        n_tags = len(self.tag_suffixes)
+        step_values = (
+            "TAGSTEP", timestamp, station, ref_name, repeat_idx,
+            step_name, int(self.current_port_config), float(angle_deg), float(dwell_s),
+            active_ants_str,
+        )
+        tagstep_cols = {k: [v] * n_tags for k, v in zip(TAGSTEP_STEP_COLUMNS, step_values)}
+        tagstep_cols.update({k: [] for k in TAGSTEP_TAG_COLUMNS})
+        tagstep_cols["tag_label"] = list(self.tag_labels)
+        tagstep_cols["tag_suffix"] = list(self.tag_suffixes)
+        tagstep_cols["tag_location"] = list(self.tag_locations)
+
+        # Single pass over tags: target sets, target stats input and TAGSTEP columns
         ant1_targets = set()
         ant2_targets = set()
         ant1_target_data = []  # (suffix, rssi, count)
         ant2_target_data = []
-        
-        for epc, info in inv1.items():
-            suf = epc[-4:] if len(epc) >= 4 else ""
-            if suf in self.tag_suffixes:
-                ant1_targets.add(suf)
-                ant1_target_data.append((suf, info.get("rssi", -99.0), info.get("count", 0)))
-        
-        for epc, info in inv2.items():
-            suf = epc[-4:] if len(epc) >= 4 else ""
-            if suf in self.tag_suffixes:
-                ant2_targets.add(suf)
-                ant2_target_data.append((suf, info.get("rssi", -99.0), info.get("count", 0)))
+        ant1_obs = {}  # suffix -> (rssi, count), seen tags only
+        ant2_obs = {}
+        ant_specs = (
+            (idx1, ant1_targets, ant1_target_data, ant1_obs,
+             tagstep_cols["ant1_seen"], tagstep_cols["ant1_rssi"], tagstep_cols["ant1_count"]),
+            (idx2, ant2_targets, ant2_target_data, ant2_obs,
+             tagstep_cols["ant2_seen"], tagstep_cols["ant2_rssi"], tagstep_cols["ant2_count"]),
+        )
+        for suffix in self.tag_suffixes:
+            for idx, targets, target_data, obs, seen_col, rssi_col, count_col in ant_specs:
+                info = idx.get(suffix)
+                if info is None:
+                    seen_col.append(0)
+                    rssi_col.append("")
+                    count_col.append(0)
+                    continue
+                rssi = float(info.get("rssi", -99.0))
+                count = int(info.get("count", 0))
+                targets.add(suffix)
+                target_data.append((suffix, rssi, count))
+                obs[suffix] = (rssi, count)
+                seen_col.append(1)
+                rssi_col.append(f"{rssi:.1f}")
+                count_col.append(count)
 
         # Calculate per-antenna target stats
         def calc_target_stats(target_data):
             if not target_data:
                 return {"total_reads": 0, "rssi_min": "", "rssi_max": "", "rssi_avg": ""}
-            rssi_vals = [d[1] for d in target_data]
-            total_reads = sum(d[2] for d in target_data)
+            _, rssi_vals, counts = zip(*target_data)
+            total_reads = sum(counts)
             return {
                 "total_reads": total_reads,
                 "rssi_min": f"{min(rssi_vals):.1f}",
@@ -1295,92 +1537,58 @@ class CalibV4GUI:
         ant2_stats = calc_target_stats(ant2_target_data)
 
         # Build missed lists - separate suffixes, labels, locations
-        def get_label(suf):
-            idx = self.tag_suffixes.index(suf) if suf in self.tag_suffixes else -1
-            return self.tag_labels[idx] if 0 <= idx < len(self.tag_labels) else ""
+        get_label = self._suffix_to_label.get
+        get_location = self._suffix_to_location.get
         
-        def get_location(suf):
-            idx = self.tag_suffixes.index(suf) if suf in self.tag_suffixes else -1
-            return self.tag_locations[idx] if 0 <= idx < len(self.tag_locations) else ""
-        
-        missed1_suffixes = sorted(list(set(self.tag_suffixes) - ant1_targets))
-        missed2_suffixes = sorted(list(set(self.tag_suffixes) - ant2_targets))
-        missed1_labels = [get_label(s) for s in missed1_suffixes]
-        missed2_labels = [get_label(s) for s in missed2_suffixes]
-        missed1_locations = [get_location(s) for s in missed1_suffixes]
-        missed2_locations = [get_location(s) for s in missed2_suffixes]
+        missed1_suffixes = sorted(self._tag_suffix_set - ant1_targets)
+        missed2_suffixes = sorted(self._tag_suffix_set - ant2_targets)
+        missed1_labels = [get_label(s, "") for s in missed1_suffixes]
+        missed2_labels = [get_label(s, "") for s in missed2_suffixes]
+        missed1_locations = [get_location(s, "") for s in missed1_suffixes]
+        missed2_locations = [get_location(s, "") for s in missed2_suffixes]
 
         v1, v2 = self.lut.get_voltages(self.current_port_config, angle_deg)
 
-        step_row = {
-            "record_type": "STEP",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-            "station": station,
-            "ref_antenna_name": ref_name,
-            "repeat": repeat_idx,
-            "beam_state": step_name,
-            "port_config": int(self.current_port_config),
-            "angle_deg": float(angle_deg),
-            "v_ch1": float(v1),
-            "v_ch2": float(v2),
-            "dwell_s": float(dwell_s),
-            "active_antennas": "|".join(map(str, self.current_antennas)),
+        step_row = StepRow(
+            record_type="STEP",
+            timestamp=timestamp,
+            station=station,
+            ref_antenna_name=ref_name,
+            repeat=repeat_idx,
+            beam_state=step_name,
+            port_config=int(self.current_port_config),
+            angle_deg=float(angle_deg),
+            v_ch1=float(v1),
+            v_ch2=float(v2),
+            dwell_s=float(dwell_s),
+            active_antennas=active_ants_str,
 
             # Coverage counts
-            "ant1_unique_epc_n": len(ant1_epcs),
-            "ant2_unique_epc_n": len(ant2_epcs),
-            "ant1_targets_seen_n": len(ant1_targets),
-            "ant2_targets_seen_n": len(ant2_targets),
-            "tags_total": len(self.tag_suffixes),
+            ant1_unique_epc_n=len(ant1_epcs),
+            ant2_unique_epc_n=len(ant2_epcs),
+            ant1_targets_seen_n=len(ant1_targets),
+            ant2_targets_seen_n=len(ant2_targets),
+            tags_total=len(self.tag_suffixes),
 
             # Per-antenna target stats
-            "ant1_total_reads_targets": ant1_stats["total_reads"],
-            "ant1_rssi_min_targets": ant1_stats["rssi_min"],
-            "ant1_rssi_max_targets": ant1_stats["rssi_max"],
-            "ant1_rssi_avg_targets": ant1_stats["rssi_avg"],
+            ant1_total_reads_targets=ant1_stats["total_reads"],
+            ant1_rssi_min_targets=ant1_stats["rssi_min"],
+            ant1_rssi_max_targets=ant1_stats["rssi_max"],
+            ant1_rssi_avg_targets=ant1_stats["rssi_avg"],
             
-            "ant2_total_reads_targets": ant2_stats["total_reads"],
-            "ant2_rssi_min_targets": ant2_stats["rssi_min"],
-            "ant2_rssi_max_targets": ant2_stats["rssi_max"],
-            "ant2_rssi_avg_targets": ant2_stats["rssi_avg"],
+            ant2_total_reads_targets=ant2_stats["total_reads"],
+            ant2_rssi_min_targets=ant2_stats["rssi_min"],
+            ant2_rssi_max_targets=ant2_stats["rssi_max"],
+            ant2_rssi_avg_targets=ant2_stats["rssi_avg"],
 
             # Missed - machine readable (separate columns)
-            "ant1_missed_suffixes": "|".join(missed1_suffixes),
-            "ant1_missed_labels": "|".join(missed1_labels),
-            "ant1_missed_locations": "|".join(missed1_locations),
-            "ant2_missed_suffixes": "|".join(missed2_suffixes),
-            "ant2_missed_labels": "|".join(missed2_labels),
-            "ant2_missed_locations": "|".join(missed2_locations),
-        }
-
-        # Per-tag per-step detail rows (TAGSTEP) - clean version with only ant1/ant2
-        tagstep_rows = []
-        for label, suffix, loc in zip(self.tag_labels, self.tag_suffixes, self.tag_locations):
-            t1 = self._find_tag_info_by_suffix(inv1, suffix)
-            t2 = self._find_tag_info_by_suffix(inv2, suffix)
-            tagstep_rows.append({
-                "record_type": "TAGSTEP",
-                "timestamp": step_row["timestamp"],
-                "station": station,
-                "ref_antenna_name": ref_name,
-                "repeat": repeat_idx,
-                "beam_state": step_name,
-                "port_config": int(self.current_port_config),
-                "angle_deg": float(angle_deg),
-                "dwell_s": float(dwell_s),
-                "active_antennas": "|".join(map(str, self.current_antennas)),
-
-                "tag_label": label,
-                "tag_suffix": suffix,
-                "tag_location": loc,
-
-                "ant1_seen": int(bool(t1["seen"])),
-                "ant1_rssi": "" if t1["rssi"] is None else f"{t1['rssi']:.1f}",
-                "ant1_count": int(t1["count"]),
-                "ant2_seen": int(bool(t2["seen"])),
-                "ant2_rssi": "" if t2["rssi"] is None else f"{t2['rssi']:.1f}",
-                "ant2_count": int(t2["count"]),
-            })
+            ant1_missed_suffixes="|".join(missed1_suffixes),
+            ant1_missed_labels="|".join(missed1_labels),
+            ant1_missed_locations="|".join(missed1_locations),
+            ant2_missed_suffixes="|".join(missed2_suffixes),
+            ant2_missed_labels="|".join(missed2_labels),
+            ant2_missed_locations="|".join(missed2_locations),
+        )
 
         raw = {
             "ant1_epcs": ant1_epcs,
@@ -1389,8 +1597,10 @@ class CalibV4GUI:
             "ant2_targets": ant2_targets,
             "ant1_target_data": ant1_target_data,
             "ant2_target_data": ant2_target_data,
+            "ant1_obs": ant1_obs,
+            "ant2_obs": ant2_obs,
         }
-        return step_row, tagstep_rows, raw
+        return step_row, tagstep_cols, raw
 
     def run_afsuam_sweep_protocol(self, station_name: str, ref_name: str, dwell_s: float, repeats: int, port_config: int):
         if not self.reader or not self.reader.connected:
@@ -1407,6 +1617,8 @@ class CalibV4GUI:
         presets = self.lut.get_beam_presets(int(port_config))
         steps = [("LEFT", presets["LEFT"]), ("CENTER", presets["CENTER"]), ("RIGHT", presets["RIGHT"])]
 
+        active_ants_str = self._active_ants_str
+
         all_runs = []
         for r in range(1, int(repeats) + 1):
             union_ant1_epcs, union_ant2_epcs = set(), set()
@@ -1419,7 +1631,7 @@ class CalibV4GUI:
                               for s in self.tag_suffixes}
 
             for beam_state, ang in steps:
-                step_row, tagstep_rows, raw = self._collect_step(
+                step_row, tagstep_cols, raw = self._collect_step(
                     step_name=beam_state,
                     dwell_s=float(dwell_s),
                     angle_deg=float(ang),
@@ -1430,30 +1642,19 @@ class CalibV4GUI:
                 )
 
                 self.afsuam_step_rows.append(step_row)
-                self.afsuam_tagstep_rows.extend(tagstep_rows)
+                self.afsuam_tagstep_rows.extend_columns(tagstep_cols, len(tagstep_cols["tag_suffix"]))
 
                 union_ant1_epcs |= raw["ant1_epcs"]
                 union_ant2_epcs |= raw["ant2_epcs"]
                 union_ant1_targets |= raw["ant1_targets"]
                 union_ant2_targets |= raw["ant2_targets"]
                 
-                # Update best beam tracking from tagstep_rows
-                for ts in tagstep_rows:
-                    suf = ts["tag_suffix"]
-                    # Ant1
-                    if ts["ant1_seen"] == 1:
-                        rssi = float(ts["ant1_rssi"]) if ts["ant1_rssi"] else -99.0
-                        count = ts["ant1_count"]
-                        curr = tag_best_beam[suf]["ant1"]
+                # Update best beam tracking from the raw per-tag observations
+                for ant, obs in (("ant1", raw["ant1_obs"]), ("ant2", raw["ant2_obs"])):
+                    for suf, (rssi, count) in obs.items():
+                        curr = tag_best_beam[suf][ant]
                         if curr["rssi"] is None or rssi > curr["rssi"] or (rssi == curr["rssi"] and count > curr["count"]):
-                            tag_best_beam[suf]["ant1"] = {"beam": beam_state, "rssi": rssi, "count": count}
-                    # Ant2
-                    if ts["ant2_seen"] == 1:
-                        rssi = float(ts["ant2_rssi"]) if ts["ant2_rssi"] else -99.0
-                        count = ts["ant2_count"]
-                        curr = tag_best_beam[suf]["ant2"]
-                        if curr["rssi"] is None or rssi > curr["rssi"] or (rssi == curr["rssi"] and count > curr["count"]):
-                            tag_best_beam[suf]["ant2"] = {"beam": beam_state, "rssi": rssi, "count": count}
+                            tag_best_beam[suf][ant] = {"beam": beam_state, "rssi": rssi, "count": count}
 
             # Build best beam per tag strings
             ant1_best_beam = []
@@ -1469,62 +1670,65 @@ class CalibV4GUI:
                 ant2_best_rssi.append(f"{suf}:{bb2['rssi']:.1f}" if bb2["rssi"] else f"{suf}:MISS")
 
             # Build missed lists - machine readable
-            def get_label(suf):
-                idx = self.tag_suffixes.index(suf) if suf in self.tag_suffixes else -1
-                return self.tag_labels[idx] if 0 <= idx < len(self.tag_labels) else ""
-            
-            def get_location(suf):
-                idx = self.tag_suffixes.index(suf) if suf in self.tag_suffixes else -1
-                return self.tag_locations[idx] if 0 <= idx < len(self.tag_locations) else ""
+            get_label = self._suffix_to_label.get
+            get_location = self._suffix_to_location.get
             
-            union_missed1_suffixes = sorted(list(set(self.tag_suffixes) - union_ant1_targets))
-            union_missed2_suffixes = sorted(list(set(self.tag_suffixes) - union_ant2_targets))
-            union_missed1_labels = [get_label(s) for s in union_missed1_suffixes]
-            union_missed2_labels = [get_label(s) for s in union_missed2_suffixes]
-            union_missed1_locations = [get_location(s) for s in union_missed1_suffixes]
-            union_missed2_locations = [get_location(s) for s in union_missed2_suffixes]
+            union_missed1_suffixes = sorted(self._tag_suffix_set - union_ant1_targets)
+            union_missed2_suffixes = sorted(self._tag_suffix_set - union_ant2_targets)
+            union_missed1_labels = [get_label(s, "") for s in union_missed1_suffixes]
+            union_missed2_labels = [get_label(s, "") for s in union_missed2_suffixes]
+            union_missed1_locations = [get_location(s, "") for s in union_missed1_suffixes]
+            union_missed2_locations = [get_location(s, "") for s in union_missed2_suffixes]
 
             # Ant2 health check
             ant2_health = "OK" if len(union_ant2_targets) > 0 else ("DISABLED" if 2 not in self.current_antennas else "NO_TAG_REPORTS")
 
-            union_row = {
-                "record_type": "UNION",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-                "station": station_name,
-                "ref_antenna_name": ref_name,
-                "repeat": r,
-                "port_config": int(port_config),
-                "dwell_s": float(dwell_s),
-                "active_antennas": "|".join(map(str, self.current_antennas)),
-                "tags_total": len(self.tag_suffixes),
-
-                "union_ant1_unique_epc_n": len(union_ant1_epcs),
-                "union_ant2_unique_epc_n": len(union_ant2_epcs),
-                "union_ant1_targets_seen_n": len(union_ant1_targets),
-                "union_ant2_targets_seen_n": len(union_ant2_targets),
+            union_row = UnionRow(
+                record_type="UNION",
+                timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                station=station_name,
+                ref_antenna_name=ref_name,
+                repeat=r,
+                port_config=int(port_config),
+                dwell_s=float(dwell_s),
+                active_antennas=active_ants_str,
+                tags_total=len(self.tag_suffixes),
+
+                union_ant1_unique_epc_n=len(union_ant1_epcs),
+                union_ant2_unique_epc_n=len(union_ant2_epcs),
+                union_ant1_targets_seen_n=len(union_ant1_targets),
+                union_ant2_targets_seen_n=len(union_ant2_targets),
 
                 # Missed - machine readable
-                "ant1_missed_suffixes": "|".join(union_missed1_suffixes),
-                "ant1_missed_labels": "|".join(union_missed1_labels),
-                "ant1_missed_locations": "|".join(union_missed1_locations),
-                "ant2_missed_suffixes": "|".join(union_missed2_suffixes),
-                "ant2_missed_labels": "|".join(union_missed2_labels),
-                "ant2_missed_locations": "|".join(union_missed2_locations),
+                ant1_missed_suffixes="|".join(union_missed1_suffixes),
+                ant1_missed_labels="|".join(union_missed1_labels),
+                ant1_missed_locations="|".join(union_missed1_locations),
+                ant2_missed_suffixes="|".join(union_missed2_suffixes),
+                ant2_missed_labels="|".join(union_missed2_labels),
+                ant2_missed_locations="|".join(union_missed2_locations),
 
                 # Best beam per tag
-                "ant1_best_beam_per_tag": "|".join(ant1_best_beam),
-                "ant1_best_rssi_per_tag": "|".join(ant1_best_rssi),
-                "ant2_best_beam_per_tag": "|".join(ant2_best_beam),
-                "ant2_best_rssi_per_tag": "|".join(ant2_best_rssi),
+                ant1_best_beam_per_tag="|".join(ant1_best_beam),
+                ant1_best_rssi_per_tag="|".join(ant1_best_rssi),
+                ant2_best_beam_per_tag="|".join(ant2_best_beam),
+                ant2_best_rssi_per_tag="|".join(ant2_best_rssi),
                 
                 # Health check
-                "ant2_health": ant2_health,
-            }
+                ant2_health=ant2_health,
+            )
             self.afsuam_union_rows.append(union_row)
             all_runs.append(union_row)
 
         return all_runs
 
+    @staticmethod
+    def _read_entry_safe(widget, default, cast=str):
+        """Return cast() of a widget's stripped text, or default if reading or casting fails."""
+        try:
+            return cast(widget.get().strip())
+        except Exception:
+            return default
+
     def start_afsuam_protocol_thread(self):
         if not self.reader or not self.reader.connected:
             messagebox.showwarning("AFSUAM", "Connect reader first.")
@@ -1535,20 +1739,9 @@ class CalibV4GUI:
         if not ref_name:
             ref_name = "REF_ANT"
 
-        try:
-            dwell_s = float(self.ent_dwell.get().strip())
-        except Exception:
-            dwell_s = 3.0
-
-        try:
-            repeats = int(self.ent_repeats.get().strip())
-        except Exception:
-            repeats = 3
-
-        try:
-            port_config = int(self.cb_pc.get().strip())
-        except Exception:
-            port_config = int(self.current_port_config)
+        dwell_s = self._read_entry_safe(self.ent_dwell, 3.0, float)
+        repeats = self._read_entry_safe(self.ent_repeats, 3, int)
+        port_config = self._read_entry_safe(self.cb_pc, int(self.current_port_config), int)
 
         # Determine protocol type based on antenna mode
         is_ant2_only = (self.current_antennas == [2])
@@ -1590,8 +1783,8 @@ class CalibV4GUI:
                     last = self.afsuam_union_rows[-1] if self.afsuam_union_rows else None
                     if last:
                         msg = (
-                            f"Done. Union targets: Ant1={last['union_ant1_targets_seen_n']}/{len(self.tag_suffixes)} "
-                            f"Ant2={last['union_ant2_targets_seen_n']}/{len(self.tag_suffixes)}"
+                            f"Done. Union targets: Ant1={last.union_ant1_targets_seen_n}/{len(self.tag_suffixes)} "
+                            f"Ant2={last.union_ant2_targets_seen_n}/{len(self.tag_suffixes)}"
                         )
                         self.root.after(0, lambda: self.lbl_status.config(text=msg))
 
@@ -1615,6 +1808,8 @@ class CalibV4GUI:
         if not self.current_antennas:
             raise RuntimeError("No antennas are active.")
 
+        active_ants_str = self._active_ants_str
+
         for r in range(1, int(repeats) + 1):
             self._log(f"Simple Inventory repeat {r}/{repeats}: dwell={dwell_s:.1f}s")
             
@@ -1630,17 +1825,15 @@ class CalibV4GUI:
             active_inv = inv2 if self.current_antennas == [2] else inv
 
             # Calculate per-tag statistics
+            inv_index = self._index_by_suffix(active_inv)
             tag_stats = []
             all_rssi = []
             total_reads = 0
             tags_seen = 0
+            missed_suffixes = []
             
             for label, suffix, loc in zip(self.tag_labels, self.tag_suffixes, self.tag_locations):
-                tag_info = None
-                for epc, info in active_inv.items():
-                    if epc.endswith(suffix):
-                        tag_info = info
-                        break
+                tag_info = inv_index.get(suffix)
                 
                 if tag_info:
                     rssi = float(tag_info.get("rssi", -99.0))
@@ -1661,6 +1854,7 @@ class CalibV4GUI:
                         "phase": phase,
                     })
                 else:
+                    missed_suffixes.append(suffix)
                     tag_stats.append({
                         "tag_label": label,
                         "tag_suffix": suffix,
@@ -1680,100 +1874,111 @@ class CalibV4GUI:
                 rssi_min = rssi_max = rssi_avg = None
 
             # Build summary row
-            summary_row = {
-                "record_type": "SIMPLE_INV",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-                "station": station_name,
-                "ref_antenna_name": ref_name,
-                "repeat": r,
-                "dwell_s": float(dwell_s),
-                "active_antennas": "|".join(map(str, self.current_antennas)),
-                "tags_seen": tags_seen,
-                "tags_total": len(self.tag_suffixes),
-                "total_reads": total_reads,
-                "rssi_min": f"{rssi_min:.1f}" if rssi_min else "",
-                "rssi_max": f"{rssi_max:.1f}" if rssi_max else "",
-                "rssi_avg": f"{rssi_avg:.1f}" if rssi_avg else "",
-            }
+            summary_row = StepRow(
+                record_type="SIMPLE_INV",
+                timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                station=station_name,
+                ref_antenna_name=ref_name,
+                repeat=r,
+                dwell_s=float(dwell_s),
+                active_antennas=active_ants_str,
+                tags_seen=tags_seen,
+                tags_total=len(self.tag_suffixes),
+                total_reads=total_reads,
+                rssi_min=f"{rssi_min:.1f}" if rssi_min else "",
+                rssi_max=f"{rssi_max:.1f}" if rssi_max else "",
+                rssi_avg=f"{rssi_avg:.1f}" if rssi_avg else "",
+            )
             
             # Store for export
             self.afsuam_step_rows.append(summary_row)
             
             # Store per-tag detail rows
             for ts in tag_stats:
-                tagstep_row = {
-                    "record_type": "SIMPLE_TAG",
-                    "timestamp": summary_row["timestamp"],
-                    "station": station_name,
-                    "ref_antenna_name": ref_name,
-                    "repeat": r,
-                    "dwell_s": float(dwell_s),
-                    "active_antennas": "|".join(map(str, self.current_antennas)),
-                    "tag_label": ts["tag_label"],
-                    "tag_suffix": ts["tag_suffix"],
-                    "tag_location": ts["tag_location"],
-                    "seen": ts["seen"],
-                    "rssi": f"{ts['rssi']:.1f}" if ts["rssi"] else "",
-                    "count": ts["count"],
-                    "phase": f"{ts['phase']:.1f}" if ts["phase"] else "",
-                }
+                tagstep_row = TagStepRow(
+                    record_type="SIMPLE_TAG",
+                    timestamp=summary_row.timestamp,
+                    station=station_name,
+                    ref_antenna_name=ref_name,
+                    repeat=r,
+                    dwell_s=float(dwell_s),
+                    active_antennas=active_ants_str,
+                    tag_label=ts["tag_label"],
+                    tag_suffix=ts["tag_suffix"],
+                    tag_location=ts["tag_location"],
+                    seen=ts["seen"],
+                    rssi=f"{ts['rssi']:.1f}" if ts["rssi"] else "",
+                    count=ts["count"],
+                    phase=f"{ts['phase']:.1f}" if ts["phase"] else "",
+                )
                 self.afsuam_tagstep_rows.append(tagstep_row)
             
             # Build missed list with labels
+            suffix_to_label = self._suffix_to_label
+
             def suffix_with_label(suf):
-                idx = self.tag_suffixes.index(suf) if suf in self.tag_suffixes else -1
-                if idx >= 0 and idx < len(self.tag_labels):
-                    return f"{suf}({self.tag_labels[idx]})"
+                if suf in suffix_to_label:
+                    return f"{suf}({suffix_to_label[suf]})"
                 return suf
             
-            seen_suffixes = {ts["tag_suffix"] for ts in tag_stats if ts["seen"]}
-            missed_suffixes = sorted(list(set(self.tag_suffixes) - seen_suffixes))
-            missed_labels = [suffix_with_label(s) for s in missed_suffixes]
+            missed_labels = [suffix_with_label(s) for s in sorted(set(missed_suffixes))]
             
             # Create a union-style row for display in union table
-            union_row = {
-                "record_type": "SIMPLE_UNION",
-                "timestamp": summary_row["timestamp"],
-                "station": station_name,
-                "ref_antenna_name": ref_name,
-                "repeat": r,
-                "port_config": "-",
-                "dwell_s": float(dwell_s),
-                "active_antennas": "|".join(map(str, self.current_antennas)),
-                "union_ant1_unique_epc_n": 0,
-                "union_ant2_unique_epc_n": len(active_inv),
-                "union_ant1_targets_seen_n": 0,
-                "union_ant2_targets_seen_n": tags_seen,
-                "union_ant1_missed_targets": "",
-                "union_ant2_missed_targets": "|".join(missed_labels),
-            }
+            union_row = UnionRow(
+                record_type="SIMPLE_UNION",
+                timestamp=summary_row.timestamp,
+                station=station_name,
+                ref_antenna_name=ref_name,
+                repeat=r,
+                port_config="-",
+                dwell_s=float(dwell_s),
+                active_antennas=active_ants_str,
+                union_ant1_unique_epc_n=0,
+                union_ant2_unique_epc_n=len(active_inv),
+                union_ant1_targets_seen_n=0,
+                union_ant2_targets_seen_n=tags_seen,
+                union_ant1_missed_targets="",
+                union_ant2_missed_targets="|".join(missed_labels),
+            )
             self.afsuam_union_rows.append(union_row)
 
     def refresh_union_table(self):
-        self.tree_union.delete(*self.tree_union.get_children())
-        for u in self.afsuam_union_rows[-250:]:
-            self.tree_union.insert(
-                "", tk.END,
-                values=(
-                    u.get("station", ""),
-                    u.get("ref_antenna_name", ""),
-                    u.get("repeat", ""),
-                    u.get("port_config", ""),
-                    u.get("dwell_s", ""),
-                    u.get("union_ant1_targets_seen_n", ""),
-                    u.get("union_ant2_targets_seen_n", ""),
-                    u.get("union_ant1_unique_epc_n", ""),
-                    u.get("union_ant2_unique_epc_n", ""),
-                    u.get("union_ant1_missed_targets", ""),
-                    u.get("union_ant2_missed_targets", ""),
-                )
-            )
+        """
+        Show the latest union rows. Union rows are append-only between clears,
+        so only the rows added since the last refresh are inserted and only
+        the rows that scrolled out of the window are deleted.
+        """
+        # The protocol thread may append while this runs, so rows are read by
+        # absolute index up to the length taken here, never from the end
+        rows = self.afsuam_union_rows
+        total = len(rows)
+        start = self._union_table_total
+        added = total - start
+        if added == 0:
+            return
+        self._union_table_total = total
+
+        children = self.tree_union.get_children()
+        if added < 0 or added >= UNION_TABLE_MAX_ROWS:
+            with self._batch_tree_update(self.tree_union):
+                for u in rows[max(total - UNION_TABLE_MAX_ROWS, 0):total]:
+                    self.tree_union.insert("", tk.END, values=_union_table_values(u))
+            return
+
+        overflow = len(children) + added - UNION_TABLE_MAX_ROWS
+        if overflow > 0:
+            self.tree_union.delete(*children[:overflow])
+        for u in rows[start:total]:
+            self.tree_union.insert("", tk.END, values=_union_table_values(u))
 
     def clear_afsuam_results(self):
-        self.afsuam_step_rows = []
-        self.afsuam_tagstep_rows = []
+        self.afsuam_step_rows.close()
+        self.afsuam_tagstep_rows.close()
+        self.afsuam_step_rows = RowSpool(STEP_HEADERS)
+        self.afsuam_tagstep_rows = RowSpool(TAGSTEP_HEADERS)
         self.afsuam_union_rows = []
         self.tree_union.delete(*self.tree_union.get_children())
+        self._union_table_total = 0
         self._log("Cleared AFSUAM protocol results.")
         self.lbl_status.config(text="AFSUAM results cleared.")
 
@@ -1799,32 +2004,27 @@ class CalibV4GUI:
             return
 
         v1, v2 = self.lut.get_voltages(int(self.current_port_config), float(self.current_angle))
-        try:
-            with open(filename, "w", newline="") as f:
-                wr = csv.writer(f)
-                wr.writerow([
-                    "timestamp", "epc", "suffix", "count", "rssi", "phase", "doppler", "antenna",
-                    "port_config", "angle_deg", "v_ch1", "v_ch2"
-                ])
-                for epc, info in inv.items():
-                    wr.writerow([
-                        info.get("timestamp", ""),
-                        epc,
-                        epc[-4:],
-                        info.get("count", 0),
-                        info.get("rssi", -99.0),
-                        info.get("phase", 0.0),
-                        info.get("doppler", 0.0),
-                        info.get("antenna", 1),
-                        int(self.current_port_config),
-                        float(self.current_angle),
-                        f"{v1:.3f}",
-                        f"{v2:.3f}",
-                    ])
-            self._log(f"Exported live snapshot: {filename} (N={len(inv)})")
-            messagebox.showinfo("Export", f"Saved: {filename}")
-        except Exception as e:
-            messagebox.showerror("Export", str(e))
+        beam = {
+            "port_config": int(self.current_port_config),
+            "angle_deg": float(self.current_angle),
+            "v_ch1": f"{v1:.3f}",
+            "v_ch2": f"{v2:.3f}",
+        }
+
+        def worker():
+            try:
+                with open(filename, "w", newline="", buffering=EXPORT_BUFFER_SIZE) as f:
+                    dw = csv.DictWriter(f, fieldnames=LIVE_SNAPSHOT_HEADERS, extrasaction="ignore", restval="")
+                    dw.writeheader()
+                    # Reader records carry every inventory column; add the beam state
+                    dw.writerows({**info, **beam} for info in inv.values())
+                self._log(f"Exported live snapshot: {filename} (N={len(inv)})")
+                self.root.after(0, lambda: messagebox.showinfo("Export", f"Saved: {filename}"))
+            except Exception as e:
+                err = str(e)
+                self.root.after(0, lambda: messagebox.showerror("Export", err))
+
+        threading.Thread(target=worker, daemon=True).start()
 
     def export_afsuam_csv(self):
         if not (self.afsuam_step_rows or self.afsuam_tagstep_rows or self.afsuam_union_rows):
@@ -1853,151 +2053,123 @@ class CalibV4GUI:
             return
 
         # Build run metadata
-        try:
-            reader_ip = self.ent_ip.get().strip()
-            tx_power = self.ent_pwr.get().strip()
-        except:
-            reader_ip = "unknown"
-            tx_power = "unknown"
-        
-        try:
-            mcu_port = self.cb_port.get().strip() if self.serial and self.serial.is_open else "disconnected"
-            mcu_connected = 1 if self.serial and self.serial.is_open else 0
-        except:
-            mcu_port = "unknown"
-            mcu_connected = 0
-        
-        reader_connected = 1 if self.reader and self.reader.connected else 0
-        
-        # Get protocol params from last run if available
-        try:
-            dwell_s = float(self.ent_dwell.get().strip())
-            repeats = int(self.ent_repeats.get().strip())
-            port_config = int(self.cb_pc.get().strip())
-        except:
-            dwell_s = 3.0
-            repeats = 3
-            port_config = 0
-        
-        run_metadata = {
-            "run_id": timestamp_str,
-            "export_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "software_version": "CalibV4_AFSUAM_v2.2",
-            "station": station,
-            "reader_ip": reader_ip,
-            "reader_connected": reader_connected,
-            "tx_power_dbm": tx_power,
-            "mcu_port": mcu_port,
-            "mcu_connected": mcu_connected,
-            "active_antennas": "|".join(map(str, self.current_antennas)),
-            "antenna_mode": ant_mode_str,
-            "port2_enabled": 1 if 2 in self.current_antennas else 0,
-            "protocol_dwell_s": dwell_s,
-            "protocol_repeats": repeats,
-            "port_config": port_config,
-            "beam_sequence": "LEFT|CENTER|RIGHT",
-            "lut_file": self.lut.csv_path if self.lut.loaded else "not_loaded",
-            "total_tags_configured": len(self.tag_suffixes),
-            "tag_suffixes": "|".join(self.tag_suffixes),
-        }
+        mcu_open = bool(self.serial and self.serial.is_open)
+        run_metadata = RunMetadata(
+            run_id=timestamp_str,
+            export_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            software_version="CalibV4_AFSUAM_v2.2",
+            station=station,
+            reader_ip=self._read_entry_safe(self.ent_ip, "unknown"),
+            reader_connected=1 if self.reader and self.reader.connected else 0,
+            tx_power_dbm=self._read_entry_safe(self.ent_pwr, "unknown"),
+            mcu_port=self._read_entry_safe(self.cb_port, "unknown") if mcu_open else "disconnected",
+            mcu_connected=1 if mcu_open else 0,
+            active_antennas=self._active_ants_str,
+            antenna_mode=ant_mode_str,
+            port2_enabled=1 if self._ant2_active else 0,
+            # Protocol params from the entries, as used by the last run
+            protocol_dwell_s=self._read_entry_safe(self.ent_dwell, 3.0, float),
+            protocol_repeats=self._read_entry_safe(self.ent_repeats, 3, int),
+            port_config=self._read_entry_safe(self.cb_pc, 0, int),
+            beam_sequence="LEFT|CENTER|RIGHT",
+            lut_file=self.lut.csv_path if self.lut.loaded else "not_loaded",
+            total_tags_configured=len(self.tag_suffixes),
+            tag_suffixes=self._tag_suffixes_joined,
+        )
 
-        # STEP headers - all fields including new RSSI stats
-        step_headers = [
-            "record_type", "timestamp", "station", "ref_antenna_name", "repeat",
-            "beam_state", "port_config", "angle_deg", "v_ch1", "v_ch2", "dwell_s",
-            "active_antennas", "tags_total",
-            "ant1_unique_epc_n", "ant2_unique_epc_n", 
-            "ant1_targets_seen_n", "ant2_targets_seen_n",
-            "ant1_total_reads_targets", "ant1_rssi_min_targets", "ant1_rssi_max_targets", "ant1_rssi_avg_targets",
-            "ant2_total_reads_targets", "ant2_rssi_min_targets", "ant2_rssi_max_targets", "ant2_rssi_avg_targets",
-            "ant1_missed_suffixes", "ant1_missed_labels", "ant1_missed_locations",
-            "ant2_missed_suffixes", "ant2_missed_labels", "ant2_missed_locations",
-            # Simple inventory fields (for SIMPLE_INV records)
-            "tags_seen", "total_reads", "rssi_min", "rssi_max", "rssi_avg"
-        ]
-
-        # TAGSTEP headers - clean version
-        tagstep_headers = [
-            "record_type", "timestamp", "station", "ref_antenna_name", "repeat",
-            "beam_state", "port_config", "angle_deg", "dwell_s",
-            "active_antennas",
-            "tag_label", "tag_suffix", "tag_location",
-            "ant1_seen", "ant1_rssi", "ant1_count",
-            "ant2_seen", "ant2_rssi", "ant2_count",
-            # Simple tag fields (for SIMPLE_TAG records)
-            "seen", "rssi", "count", "phase"
-        ]
-
-        # UNION headers - with best beam per tag
-        union_headers = [
-            "record_type", "timestamp", "station", "ref_antenna_name", "repeat",
-            "port_config", "dwell_s", "active_antennas", "tags_total",
-            "union_ant1_unique_epc_n", "union_ant2_unique_epc_n",
-            "union_ant1_targets_seen_n", "union_ant2_targets_seen_n",
-            "ant1_missed_suffixes", "ant1_missed_labels", "ant1_missed_locations",
-            "ant2_missed_suffixes", "ant2_missed_labels", "ant2_missed_locations",
-            "ant1_best_beam_per_tag", "ant1_best_rssi_per_tag",
-            "ant2_best_beam_per_tag", "ant2_best_rssi_per_tag",
-            "ant2_health"
-        ]
+        # Write on a worker thread; the buttons stay disabled until it finishes so
+        # the spools cannot be cleared (closed) or exported twice concurrently.
+        step_rows, tagstep_rows = self.afsuam_step_rows, self.afsuam_tagstep_rows
+        union_rows = list(self.afsuam_union_rows)
+        self.btn_export_protocol.config(state=tk.DISABLED)
+        self.btn_clear_protocol.config(state=tk.DISABLED)
+        self.lbl_status.config(text=f"Exporting protocol CSV: {filename}")
 
-        try:
-            with open(filename, "w", newline="") as f:
-                wr = csv.writer(f)
-
-                # Write run metadata header
-                wr.writerow(["# RUN_METADATA"])
-                for key, val in run_metadata.items():
-                    wr.writerow([f"# {key}", val])
-                wr.writerow([])
-
-                wr.writerow(["# STEP_ROWS"])
-                wr.writerow(step_headers)
-                for r in self.afsuam_step_rows:
-                    wr.writerow([r.get(h, "") for h in step_headers])
-
-                wr.writerow([])
-                wr.writerow(["# TAGSTEP_ROWS"])
-                wr.writerow(tagstep_headers)
-                for r in self.afsuam_tagstep_rows:
-                    wr.writerow([r.get(h, "") for h in tagstep_headers])
-
-                wr.writerow([])
-                wr.writerow(["# UNION_ROWS"])
-                wr.writerow(union_headers)
-                for u in self.afsuam_union_rows:
-                    wr.writerow([u.get(h, "") for h in union_headers])
-
-            self._log(
-                f"Exported: {filename} | mode={ant_mode_str} | "
-                f"steps={len(self.afsuam_step_rows)} tagsteps={len(self.afsuam_tagstep_rows)} union={len(self.afsuam_union_rows)}"
-            )
-            messagebox.showinfo("Export", f"Saved: {filename}\n\nMode: {ant_mode_str}\nStation: {station}")
-        except Exception as e:
-            messagebox.showerror("Export", str(e))
+        def worker():
+            try:
+                with open(filename, "w", newline="", buffering=EXPORT_BUFFER_SIZE) as f:
+                    wr = csv.writer(f)
+
+                    # Write run metadata header
+                    wr.writerow(["# RUN_METADATA"])
+                    wr.writerows([f"# {key}", val] for key, val in zip(RunMetadata._fields, run_metadata))
+                    wr.writerow([])
+
+                    wr.writerow(["# STEP_ROWS"])
+                    wr.writerow(STEP_HEADERS)
+                    step_rows.copy_to(f)
+
+                    wr.writerow([])
+                    wr.writerow(["# TAGSTEP_ROWS"])
+                    wr.writerow(TAGSTEP_HEADERS)
+                    tagstep_rows.copy_to(f)
+
+                    wr.writerow([])
+                    wr.writerow(["# UNION_ROWS"])
+                    wr.writerow(UNION_HEADERS)
+                    n_union = len(UNION_HEADERS)
+                    wr.writerows(u[:n_union] for u in union_rows)
+
+                self._log(
+                    f"Exported: {filename} | mode={ant_mode_str} | "
+                    f"steps={len(step_rows)} tagsteps={len(tagstep_rows)} union={len(union_rows)}"
+                )
+                self.root.after(0, lambda: self.lbl_status.config(text="Protocol CSV exported."))
+                self.root.after(0, lambda: messagebox.showinfo(
+                    "Export", f"Saved: {filename}\n\nMode: {ant_mode_str}\nStation: {station}"))
+            except Exception as e:
+                err = str(e)
+                self.root.after(0, lambda: self.lbl_status.config(text="Export failed."))
+                self.root.after(0, lambda: messagebox.showerror("Export", err))
+            finally:
+                self.root.after(0, lambda: self.btn_export_protocol.config(state=tk.NORMAL))
+                self.root.after(0, lambda: self.btn_clear_protocol.config(state=tk.NORMAL))
+
+        threading.Thread(target=worker, daemon=True).start()
 
     # =============================================================================
     # Logging
     # =============================================================================
     def _log(self, msg: str):
-        ts = datetime.now().strftime("%H:%M:%S")
-        line = f"[{ts}] {msg}\n"
-        try:
-            self.txt_log.insert(tk.END, line)
-            self.txt_log.see(tk.END)
-        except Exception:
-            pass
-        print(line, end="")
+        # Safe to call from worker threads; the widget is only touched by _flush_log
+        self._log_queue.append((time.time(), msg))
+
+    def _drain_log_lines(self) -> str:
+        """Pop all queued log messages and format them as timestamped lines."""
+        lines = []
+        last_sec, ts = None, ""
+        q = self._log_queue
+        while q:
+            t, msg = q.popleft()
+            sec = int(t)
+            if sec != last_sec:
+                last_sec, ts = sec, time.strftime("%H:%M:%S", time.localtime(sec))
+            lines.append(f"[{ts}] {msg}\n")
+        return "".join(lines)
+
+    def _flush_log(self):
+        text = self._drain_log_lines()
+        if text:
+            try:
+                self.txt_log.insert(tk.END, text)
+                self.txt_log.see(tk.END)
+            except Exception:
+                pass
+            print(text, end="")
+        self._log_timer = self.root.after(LOG_FLUSH_MS, self._flush_log)
 
     # =============================================================================
     # Shutdown
     # =============================================================================
     def on_closing(self):
-        if self.update_timer:
-            try:
-                self.root.after_cancel(self.update_timer)
-            except Exception:
-                pass
+        self._live_worker_stop.set()
+        for timer in (self.update_timer, self._log_timer):
+            if timer:
+                try:
+                    self.root.after_cancel(timer)
+                except Exception:
+                    pass
+        print(self._drain_log_lines(), end="")
 
         try:
             if self.serial and self.serial.is_open:
@@ -5,8 +5,10 @@ This module implements the L-C-R (Left-Center-Right) beam sweep protocol
 for phased array RFID measurements.
 """
 
-import time
-from typing import Dict, List, Set
+import math
+import queue
+import threading
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 
 from .base import (
@@ -18,6 +20,112 @@ from .base import (
 )
 
 
+class _AntennaScan:
+    """Per-antenna results of AFSUAMProtocol._scan_inventory."""
+    __slots__ = (
+        "inv", "targets", "target_suffix", "target_rssi", "target_count",
+        "total_reads", "by_suffix",
+        "rssi_min", "rssi_max", "rssi_sum", "rssi_n"
+    )
+    
+    def __init__(self):
+        self.inv: Dict[str, Dict] = {}
+        self.targets: Set[str] = set()
+        # Parallel per-target readings, one entry per target EPC seen
+        self.target_suffix: List[str] = []
+        self.target_rssi: List[float] = []
+        self.target_count: List[int] = []
+        self.total_reads: int = 0
+        # Configured 4-char suffix -> (epc, info) of the first EPC seen with it
+        self.by_suffix: Dict[str, tuple] = {}
+        # Running target RSSI stats (no per-step list of readings)
+        self.rssi_min: float = math.inf
+        self.rssi_max: float = -math.inf
+        self.rssi_sum: float = 0.0
+        self.rssi_n: int = 0
+    
+    def add_rssi(self, rssi: float):
+        """Fold one target reading into the running RSSI stats."""
+        if rssi < self.rssi_min:
+            self.rssi_min = rssi
+        if rssi > self.rssi_max:
+            self.rssi_max = rssi
+        self.rssi_sum += rssi
+        self.rssi_n += 1
+    
+    def target_data(self) -> Dict[str, List]:
+        """Get the per-target readings in StepResult's column-wise layout."""
+        return {"suffix": self.target_suffix, "rssi": self.target_rssi, "count": self.target_count}
+    
+    def rssi_stats(self) -> tuple:
+        """Get (min, max, avg) target RSSI, or Nones if no target was seen."""
+        if not self.rssi_n:
+            return None, None, None
+        return self.rssi_min, self.rssi_max, self.rssi_sum / self.rssi_n
+
+
+def _missed_columns(columns, seen: Set[str]) -> tuple:
+    """
+    Suffixes, labels and locations of configured tags not in seen, in one pass.
+    
+    columns is a TagManager.columns view.
+    The suffix list is shared by the legacy *_missed and *_missed_suffixes
+    fields; callers treat both as read-only.
+    """
+    suffixes, labels, locations = [], [], []
+    if columns.suffix_set - seen:
+        for i, suffix in enumerate(columns.suffixes):
+            if suffix not in seen:
+                suffixes.append(suffix)
+                labels.append(columns.labels[i])
+                locations.append(columns.locations[i])
+    return suffixes, labels, locations
+
+
+def _compute_best(beam_rssi: List[Optional[float]], beam_names: List[str], is_disabled: bool = False) -> tuple:
+    """
+    Compute best beam, rssi, seen_n, margin, tie_flag, confidence from a per-beam RSSI row.
+    
+    Single pass over the row tracking the top two readings; ties keep the
+    earlier beam, matching a stable descending sort.
+    """
+    if is_disabled:
+        return "DISABLED", None, 0, None, 0, "DISABLED"
+    
+    best_b = -1
+    best_rssi = second_rssi = None
+    seen_n = 0
+    for b, r in enumerate(beam_rssi):
+        if r is None:
+            continue
+        seen_n += 1
+        if best_rssi is None or r > best_rssi:
+            second_rssi = best_rssi
+            best_b, best_rssi = b, r
+        elif second_rssi is None or r > second_rssi:
+            second_rssi = r
+    
+    if seen_n == 0:
+        return "MISS", None, 0, None, 0, "NONE"
+    
+    # Single beam - margin is NA
+    if seen_n == 1:
+        return beam_names[best_b], best_rssi, 1, None, 0, "SINGLE"
+    
+    margin = best_rssi - second_rssi
+    tie_flag = 1 if margin == 0.0 else 0
+    
+    # Confidence based on margin
+    if margin >= 3.0:
+        confidence = "HIGH"
+    elif margin >= 1.0:
+        confidence = "MED"
+    else:
+        confidence = "LOW"
+    
+    return beam_names[best_b], best_rssi, seen_n, margin, tie_flag, confidence
+
+
 class AFSUAMProtocol(BaseProtocol):
     """
     AFSUAM L-C-R Beam Sweep Protocol.
@@ -26,6 +134,9 @@ class AFSUAMProtocol(BaseProtocol):
     while collecting RFID tag data from both antennas.
     """
     
+    # Seconds to let the array settle after the MCU applies new voltages
+    SETTLE_S = 0.8
+    
     def run(
         self,
         station_name: str = "AFSUAM Test-Bed",
@@ -59,8 +170,7 @@ class AFSUAMProtocol(BaseProtocol):
         ant2_enabled = 2 in active_antennas
         
         # Generate unique run ID
-        import uuid
-        run_id = f"{self._get_timestamp().replace(':', '').replace('-', '').replace(' ', '_')}_{uuid.uuid4().hex[:8]}"
+        run_id = self._new_run_id()
         
         # Validation errors list
         validation_errors = []
@@ -85,17 +195,17 @@ class AFSUAMProtocol(BaseProtocol):
             ]
             beam_sequence_str = "LEFT|CENTER|RIGHT"
         else:
-            # Dynamic steps from +30 to -30
-            import numpy as np
+            # Dynamic steps from +30 to -30, evenly spaced and rounded to
+            # 1 decimal place
             if beam_steps < 2: 
                 angles = [0.0]
             else:
-                angles = np.linspace(30.0, -30.0, beam_steps)
+                step = -60.0 / (beam_steps - 1)
+                angles = [round(30.0 + i * step, 1) for i in range(beam_steps - 1)]
+                angles.append(-30.0)
             
             beam_sequence_list = []
             for angle in angles:
-                # Round to 1 decimal place
-                angle = float(round(angle, 1))
                 name = f"BEAM_{int(angle) if angle.is_integer() else angle}"
                 steps.append((name, angle))
                 beam_sequence_list.append(name)
@@ -115,8 +225,8 @@ class AFSUAMProtocol(BaseProtocol):
             active_antennas=active_antennas,
             tie_break_rule="prefer_higher_rssi",
             # Target configuration
-            targets_configured_suffixes=self.tag_manager.suffixes.copy(),
-            targets_configured_labels=[t.label for t in self.tag_manager.tags],
+            targets_configured_suffixes=self.tag_manager.suffixes,
+            targets_configured_labels=self.tag_manager.labels,
             # Hardware status
             mcu_connected=self.mcu.is_connected if self.mcu else False,
             reader_connected=self.reader.connected if self.reader else False,
@@ -142,16 +252,33 @@ class AFSUAMProtocol(BaseProtocol):
             result.error_message = "MCU is not connected"
             return result
         
-        total_steps = repeats * len(steps)
-        current_step = 0
-        
         # Track if we ever see tags on each antenna
         any_ant1_tags = False
         any_ant2_tags = False
         
+        # Per-beam RSSI grids are flat lists indexed [tag_idx * n_beams + beam_idx];
+        # tag_idx follows tag_manager.tags, the order _reduce_step emits tag steps in
+        beam_names = list(dict.fromkeys(s[0] for s in steps))
+        beam_index = {name: b for b, name in enumerate(beam_names)}
+        n_beams = len(beam_names)
+        suffixes = self.tag_manager.suffixes
+        grid_size = len(suffixes) * n_beams
+        
+        # Hardware acquisition runs on its own thread, so the next step's settle
+        # and dwell overlap with the reduction of the current one below
+        acquired: "queue.Queue" = queue.Queue()
+        abort = threading.Event()
+        producer = threading.Thread(
+            target=self._acquire_steps,
+            args=(steps, repeats, port_config, dwell_s, acquired, abort),
+            daemon=True
+        )
+        producer.start()
+        stopped = False
+        
         try:
             for repeat in range(1, repeats + 1):
-                if self._stop_requested:
+                if stopped:
                     break
                 
                 # Track union coverage for this repeat
@@ -159,35 +286,29 @@ class AFSUAMProtocol(BaseProtocol):
                 union_ant2_epcs: Set[str] = set()
                 union_ant1_targets: Set[str] = set()
                 union_ant2_targets: Set[str] = set()
-                # Pre-calculate beam names for initialization
-                beam_names = [s[0] for s in steps]
                 
-                tag_best_beam: Dict[str, Dict] = {
-                    s: {
-                        "ant1": {name: None for name in beam_names},
-                        "ant2": {name: None for name in beam_names}
-                    }
-                    for s in self.tag_manager.suffixes
-                }
+                ant1_beam_rssi: List[Optional[float]] = [None] * grid_size
+                ant2_beam_rssi: List[Optional[float]] = [None] * grid_size
                 
+                steps_done = 0
                 for beam_state, angle in steps:
-                    if self._stop_requested:
+                    item = acquired.get()
+                    if item is None:
+                        # Stop requested before this step was acquired
+                        stopped = True
                         break
+                    if isinstance(item, Exception):
+                        raise item
+                    steps_done += 1
                     
-                    current_step += 1
-                    progress = current_step / total_steps
-                    self._update_progress(
-                        f"Repeat {repeat}/{repeats}: {beam_state} ({angle}°)",
-                        progress
-                    )
-                    
-                    # Collect step data
-                    step_result, tag_steps, raw = self._collect_step(
+                    # Reduce step data
+                    step_result, tag_steps, raw = self._reduce_step(
                         beam_state=beam_state,
                         angle=angle,
                         port_config=port_config,
                         dwell_s=dwell_s,
-                        active_antennas=active_antennas
+                        active_antennas=active_antennas,
+                        acquisition=item
                     )
                     
                     result.step_results.append(step_result)
@@ -200,61 +321,28 @@ class AFSUAMProtocol(BaseProtocol):
                         any_ant2_tags = True
                     
                     # Update union tracking
-                    union_ant1_epcs |= raw["ant1_epcs"]
-                    union_ant2_epcs |= raw["ant2_epcs"]
+                    union_ant1_epcs.update(raw["ant1_epcs"])
+                    union_ant2_epcs.update(raw["ant2_epcs"])
                     union_ant1_targets |= raw["ant1_targets"]
                     union_ant2_targets |= raw["ant2_targets"]
                     
                     # Track RSSI per beam per tag
+                    cell = beam_index[beam_state]
                     for ts in tag_steps:
-                        suffix = ts.tag_suffix
-                        
                         if ts.ant1_seen and ts.ant1_rssi is not None:
-                            tag_best_beam[suffix]["ant1"][beam_state] = ts.ant1_rssi
+                            ant1_beam_rssi[cell] = ts.ant1_rssi
                         
                         if ts.ant2_seen and ts.ant2_rssi is not None:
-                            tag_best_beam[suffix]["ant2"][beam_state] = ts.ant2_rssi
+                            ant2_beam_rssi[cell] = ts.ant2_rssi
+                        cell += n_beams
                 
-                # Build missed tag lists with full info (empty if antenna disabled)
-                ant1_missed_tags = self.tag_manager.get_missed_tags(union_ant1_targets) if ant1_enabled else []
-                ant2_missed_tags = self.tag_manager.get_missed_tags(union_ant2_targets) if ant2_enabled else []
+                if not steps_done:
+                    break
                 
-                # Helper to compute best beam, RSSI, margin, confidence
-                def compute_best(beam_data, is_disabled=False):
-                    """Compute best beam, rssi, seen_n, margin, tie_flag, confidence from beam RSSI dict."""
-                    if is_disabled:
-                        return "DISABLED", None, 0, None, 0, "DISABLED"
-                    
-                    rssi_list = [(b, r) for b, r in beam_data.items() if r is not None]
-                    seen_n = len(rssi_list)
-                    
-                    if seen_n == 0:
-                        return "MISS", None, 0, None, 0, "NONE"
-                    
-                    # Sort by RSSI descending
-                    rssi_list.sort(key=lambda x: x[1], reverse=True)
-                    best_beam, best_rssi = rssi_list[0]
-                    
-                    # Calculate margin and tie_flag
-                    if seen_n >= 2:
-                        second_rssi = rssi_list[1][1]
-                        margin = best_rssi - second_rssi
-                        tie_flag = 1 if margin == 0.0 else 0
-                        
-                        # Confidence based on margin
-                        if margin >= 3.0:
-                            confidence = "HIGH"
-                        elif margin >= 1.0:
-                            confidence = "MED"
-                        else:
-                            confidence = "LOW"
-                    else:
-                        # Single beam - margin is NA
-                        margin = None
-                        tie_flag = 0
-                        confidence = "SINGLE"
-                    
-                    return best_beam, best_rssi, seen_n, margin, tie_flag, confidence
+                # Build missed tag lists with full info (empty if antenna disabled)
+                columns = self.tag_manager.columns
+                ant1_miss_s, ant1_miss_l, _ = _missed_columns(columns, union_ant1_targets) if ant1_enabled else ([], [], [])
+                ant2_miss_s, ant2_miss_l, _ = _missed_columns(columns, union_ant2_targets) if ant2_enabled else ([], [], [])
                 
                 # Check if antennas are disabled
                 ant1_disabled = 1 not in active_antennas
@@ -274,9 +362,11 @@ class AFSUAMProtocol(BaseProtocol):
                 ant2_tie_flag = {}
                 ant2_best_confidence = {}
                 
-                for suffix, data in tag_best_beam.items():
+                for i, suffix in enumerate(suffixes):
+                    row = slice(i * n_beams, (i + 1) * n_beams)
+                    
                     # Ant1
-                    beam, rssi, seen_n, margin, tie, conf = compute_best(data["ant1"], ant1_disabled)
+                    beam, rssi, seen_n, margin, tie, conf = _compute_best(ant1_beam_rssi[row], beam_names, ant1_disabled)
                     ant1_best_beam[suffix] = beam
                     ant1_seen_beams_n[suffix] = seen_n
                     ant1_tie_flag[suffix] = tie
@@ -287,7 +377,7 @@ class AFSUAMProtocol(BaseProtocol):
                         ant1_best_margin[suffix] = margin
                     
                     # Ant2
-                    beam, rssi, seen_n, margin, tie, conf = compute_best(data["ant2"], ant2_disabled)
+                    beam, rssi, seen_n, margin, tie, conf = _compute_best(ant2_beam_rssi[row], beam_names, ant2_disabled)
                     ant2_best_beam[suffix] = beam
                     ant2_seen_beams_n[suffix] = seen_n
                     ant2_tie_flag[suffix] = tie
@@ -309,13 +399,13 @@ class AFSUAMProtocol(BaseProtocol):
                     ant1_targets_seen=len(union_ant1_targets),
                     ant2_targets_seen=len(union_ant2_targets),
                     # Missed - legacy format
-                    ant1_missed=[t.suffix for t in ant1_missed_tags],
-                    ant2_missed=[t.suffix for t in ant2_missed_tags],
+                    ant1_missed=ant1_miss_s,
+                    ant2_missed=ant2_miss_s,
                     # Missed - separated
-                    ant1_missed_suffixes=[t.suffix for t in ant1_missed_tags],
-                    ant1_missed_labels=[t.label for t in ant1_missed_tags],
-                    ant2_missed_suffixes=[t.suffix for t in ant2_missed_tags],
-                    ant2_missed_labels=[t.label for t in ant2_missed_tags],
+                    ant1_missed_suffixes=ant1_miss_s,
+                    ant1_missed_labels=ant1_miss_l,
+                    ant2_missed_suffixes=ant2_miss_s,
+                    ant2_missed_labels=ant2_miss_l,
                     # Best beam and RSSI
                     ant1_best_beam=ant1_best_beam,
                     ant2_best_beam=ant2_best_beam,
@@ -352,19 +442,107 @@ class AFSUAMProtocol(BaseProtocol):
             result.error_message = str(e)
             result.end_time = self._get_timestamp()
         
-        self._stop_requested = False
+        finally:
+            abort.set()
+            # Also end a settle/dwell wait in progress, so a failed reduction
+            # doesn't leave the producer steering for one more step;
+            # _clear_stop() below resets the event
+            self._stop_event.set()
+            producer.join()
+        
+        self._clear_stop()
         return result
     
-    def _collect_step(
+    def _acquire_steps(
+        self,
+        steps: List[tuple],
+        repeats: int,
+        port_config: int,
+        dwell_s: float,
+        out: "queue.Queue",
+        abort: threading.Event
+    ):
+        """
+        Producer side of run(): acquire every step of every repeat in order.
+        
+        Puts one _acquire_step() tuple per step on out, then stops. Puts None
+        if a stop was requested and the raised exception if acquisition failed.
+        """
+        total_steps = repeats * len(steps)
+        current_step = 0
+        applied = None
+        try:
+            for repeat in range(1, repeats + 1):
+                for beam_state, angle in steps:
+                    if self._stop_requested or abort.is_set():
+                        out.put(None)
+                        return
+                    
+                    current_step += 1
+                    self._update_progress(
+                        f"Repeat {repeat}/{repeats}: {beam_state} ({angle}°)",
+                        current_step / total_steps
+                    )
+                    acquisition = self._acquire_step(beam_state, angle, port_config, dwell_s, applied)
+                    if acquisition is None:
+                        out.put(None)
+                        return
+                    applied = acquisition[1:3]
+                    out.put(acquisition)
+        except Exception as e:
+            out.put(e)
+    
+    @staticmethod
+    def _scan_inventory(inventory: Dict[str, Dict], suffix_set: Set[str]) -> tuple:
+        """
+        Split inventory by antenna and pick out configured targets in one pass.
+        
+        Returns:
+            (ant1, ant2) _AntennaScan accumulators
+        """
+        ant1, ant2 = _AntennaScan(), _AntennaScan()
+        
+        for epc, info in inventory.items():
+            ant = info.get("antenna", 1)
+            scan = ant2 if ant == 2 or ant == "2" else ant1
+            scan.inv[epc] = info
+            
+            if len(epc) < 4:
+                continue
+            suffix = epc[-4:]
+            if suffix in suffix_set:
+                # Only configured suffixes are ever looked up in the index
+                if suffix not in scan.by_suffix:
+                    scan.by_suffix[suffix] = (epc, info)
+                scan.targets.add(suffix)
+                rssi = float(info.get("rssi", -99.0))
+                count = int(info.get("count", 0))
+                scan.target_suffix.append(suffix)
+                scan.target_rssi.append(rssi)
+                scan.target_count.append(count)
+                scan.add_rssi(rssi)
+                scan.total_reads += count
+        
+        return ant1, ant2
+    
+    def _acquire_step(
         self,
         beam_state: str,
         angle: float,
         port_config: int,
         dwell_s: float,
-        active_antennas: List[int]
+        prev_voltages: Optional[tuple] = None
     ) -> tuple:
-        """Collect data for a single beam step."""
+        """
+        Steer the beam, settle, and read inventory for one step.
         
+        prev_voltages is the (v_ch1, v_ch2) of the previous step in the same
+        sweep; the settle wait is skipped when this step leaves them unchanged.
+        
+        Returns:
+            (timestamp, v_ch1, v_ch2, inventory), or None if stop() cut the
+            settle or dwell short
+        """
         v1, v2 = None, None
         
         # Apply beam voltages only if not FIXED mode
@@ -372,73 +550,52 @@ class AFSUAMProtocol(BaseProtocol):
             v1, v2 = self.lut.get_voltages(port_config, angle)
             self.mcu.set_voltage(v1, v2)
         
-        # Settle time
-        time.sleep(0.8)
+        # Settle time (reader is cleared afterwards, so reads taken while the
+        # beam moves never reach the inventory)
+        if prev_voltages is None or prev_voltages != (v1, v2):
+            if self._wait(self.SETTLE_S):
+                return None
         
         # Collect data
         self.reader.clear_data()
-        time.sleep(dwell_s)
+        if self._wait(dwell_s):
+            return None
         inventory = self.reader.get_all_data()
         
-        # Split by antenna
-        inv1, inv2 = self._split_inventory_by_antenna(inventory)
-        
-        # Calculate targets and statistics for Ant1
-        ant1_targets: Set[str] = set()
-        ant1_target_data: List[Dict] = []
-        ant1_rssi_list: List[float] = []
-        ant1_total_reads: int = 0
+        return self._get_timestamp(), v1, v2, inventory
+    
+    def _reduce_step(
+        self,
+        beam_state: str,
+        angle: float,
+        port_config: int,
+        dwell_s: float,
+        active_antennas: List[int],
+        acquisition: tuple
+    ) -> tuple:
+        """Build step/tag-step results from an _acquire_step() tuple."""
+        timestamp, v1, v2, inventory = acquisition
         
-        for epc, info in inv1.items():
-            suffix = epc[-4:] if len(epc) >= 4 else ""
-            if suffix in self.tag_manager.suffixes:
-                ant1_targets.add(suffix)
-                rssi = float(info.get("rssi", -99.0))
-                count = int(info.get("count", 0))
-                ant1_target_data.append({
-                    "suffix": suffix,
-                    "rssi": rssi,
-                    "count": count
-                })
-                ant1_rssi_list.append(rssi)
-                ant1_total_reads += count
-        
-        # Calculate targets and statistics for Ant2
-        ant2_targets: Set[str] = set()
-        ant2_target_data: List[Dict] = []
-        ant2_rssi_list: List[float] = []
-        ant2_total_reads: int = 0
-        
-        for epc, info in inv2.items():
-            suffix = epc[-4:] if len(epc) >= 4 else ""
-            if suffix in self.tag_manager.suffixes:
-                ant2_targets.add(suffix)
-                rssi = float(info.get("rssi", -99.0))
-                count = int(info.get("count", 0))
-                ant2_target_data.append({
-                    "suffix": suffix,
-                    "rssi": rssi,
-                    "count": count
-                })
-                ant2_rssi_list.append(rssi)
-                ant2_total_reads += count
+        # Split by antenna and calculate target statistics in one pass
+        columns = self.tag_manager.columns
+        scan1, scan2 = self._scan_inventory(inventory, columns.suffix_set)
+        inv1, inv2 = scan1.inv, scan2.inv
+        ant1_targets, ant1_target_data = scan1.targets, scan1.target_data()
+        ant2_targets, ant2_target_data = scan2.targets, scan2.target_data()
+        ant1_total_reads, ant2_total_reads = scan1.total_reads, scan2.total_reads
         
         # Calculate RSSI statistics
-        ant1_rssi_min = min(ant1_rssi_list) if ant1_rssi_list else None
-        ant1_rssi_max = max(ant1_rssi_list) if ant1_rssi_list else None
-        ant1_rssi_avg = sum(ant1_rssi_list) / len(ant1_rssi_list) if ant1_rssi_list else None
-        
-        ant2_rssi_min = min(ant2_rssi_list) if ant2_rssi_list else None
-        ant2_rssi_max = max(ant2_rssi_list) if ant2_rssi_list else None
-        ant2_rssi_avg = sum(ant2_rssi_list) / len(ant2_rssi_list) if ant2_rssi_list else None
+        ant1_rssi_min, ant1_rssi_max, ant1_rssi_avg = scan1.rssi_stats()
+        ant2_rssi_min, ant2_rssi_max, ant2_rssi_avg = scan2.rssi_stats()
         
-        # Get missed tags with full info
-        ant1_missed_tags = [t for t in self.tag_manager.tags if t.suffix not in ant1_targets]
-        ant2_missed_tags = [t for t in self.tag_manager.tags if t.suffix not in ant2_targets]
+        # Missed tags (config order); skip the tag scan entirely when the
+        # set difference shows every target was seen
+        ant1_miss_s, ant1_miss_l, ant1_miss_loc = _missed_columns(columns, ant1_targets)
+        ant2_miss_s, ant2_miss_l, ant2_miss_loc = _missed_columns(columns, ant2_targets)
         
         # Build step result
         step_result = StepResult(
-            timestamp=self._get_timestamp(),
+            timestamp=timestamp,
             beam_state=beam_state,
             angle_deg=angle,
             port_config=port_config,
@@ -446,7 +603,7 @@ class AFSUAMProtocol(BaseProtocol):
             v_ch2=v2,
             dwell_s=dwell_s,
             active_antennas=active_antennas,
-            tags_total=self.tag_manager.count,
+            tags_total=len(columns.suffixes),
             # Ant1 stats
             ant1_unique_epc_n=len(inv1),
             ant1_targets_seen_n=len(ant1_targets),
@@ -455,10 +612,10 @@ class AFSUAMProtocol(BaseProtocol):
             ant1_rssi_min=ant1_rssi_min,
             ant1_rssi_max=ant1_rssi_max,
             ant1_rssi_avg=ant1_rssi_avg,
-            ant1_missed=[t.suffix for t in ant1_missed_tags],
-            ant1_missed_suffixes=[t.suffix for t in ant1_missed_tags],
-            ant1_missed_labels=[t.label for t in ant1_missed_tags],
-            ant1_missed_locations=[t.location for t in ant1_missed_tags],
+            ant1_missed=ant1_miss_s,
+            ant1_missed_suffixes=ant1_miss_s,
+            ant1_missed_labels=ant1_miss_l,
+            ant1_missed_locations=ant1_miss_loc,
             # Ant2 stats
             ant2_unique_epc_n=len(inv2),
             ant2_targets_seen_n=len(ant2_targets),
@@ -467,38 +624,43 @@ class AFSUAMProtocol(BaseProtocol):
             ant2_rssi_min=ant2_rssi_min,
             ant2_rssi_max=ant2_rssi_max,
             ant2_rssi_avg=ant2_rssi_avg,
-            ant2_missed=[t.suffix for t in ant2_missed_tags],
-            ant2_missed_suffixes=[t.suffix for t in ant2_missed_tags],
-            ant2_missed_labels=[t.label for t in ant2_missed_tags],
-            ant2_missed_locations=[t.location for t in ant2_missed_tags]
+            ant2_missed=ant2_miss_s,
+            ant2_missed_suffixes=ant2_miss_s,
+            ant2_missed_labels=ant2_miss_l,
+            ant2_missed_locations=ant2_miss_loc
         )
         
-        # Build per-tag results
+        # Build per-tag results; readings come back as tuples so no
+        # intermediate info dict is built per tag and antenna
         tag_steps: List[TagStepResult] = []
-        for tag in self.tag_manager.tags:
-            t1 = self._find_tag_info(inv1, tag.suffix)
-            t2 = self._find_tag_info(inv2, tag.suffix)
+        append = tag_steps.append
+        by1, by2 = scan1.by_suffix, scan2.by_suffix
+        for suffix, label, location in zip(columns.suffixes, columns.labels, columns.locations):
+            seen1, rssi1, count1, phase1 = self._tag_reading(inv1, suffix, by1)
+            seen2, rssi2, count2, phase2 = self._tag_reading(inv2, suffix, by2)
             
-            tag_steps.append(TagStepResult(
-                timestamp=step_result.timestamp,
+            append(TagStepResult(
+                timestamp=timestamp,
                 beam_state=beam_state,
-                tag_label=tag.label,
-                tag_suffix=tag.suffix,
-                tag_location=tag.location,
+                tag_label=label,
+                tag_suffix=suffix,
+                tag_location=location,
                 active_antennas=active_antennas,
-                ant1_seen=t1["seen"],
-                ant1_rssi=t1["rssi"],
-                ant1_count=t1["count"],
-                ant1_phase=t1["phase"],
-                ant2_seen=t2["seen"],
-                ant2_rssi=t2["rssi"],
-                ant2_count=t2["count"],
-                ant2_phase=t2["phase"]
+                angle_deg=angle,
+                ant1_seen=seen1,
+                ant1_rssi=rssi1,
+                ant1_count=count1,
+                ant1_phase=phase1,
+                ant2_seen=seen2,
+                ant2_rssi=rssi2,
+                ant2_count=count2,
+                ant2_phase=phase2
             ))
         
         raw = {
-            "ant1_epcs": set(inv1.keys()),
-            "ant2_epcs": set(inv2.keys()),
+            # Key views; run() folds them into its union sets with update()
+            "ant1_epcs": inv1.keys(),
+            "ant2_epcs": inv2.keys(),
             "ant1_targets": ant1_targets,
             "ant2_targets": ant2_targets
         }
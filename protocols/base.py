@@ -5,11 +5,36 @@ This module defines the base protocol class and result structures.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Any, Optional, Callable
-from datetime import datetime
+import os
+import threading
+import time
 
 
+def _slotted(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+    
+    Equivalent to @dataclass(slots=True), which needs Python 3.10+. Used on
+    the protocol result records: the per-step/per-tag ones are created many
+    times per run, and on the rest a mistyped field assignment fails loudly.
+    """
+    names = tuple(f.name for f in fields(cls))
+    ns = {
+        k: v for k, v in cls.__dict__.items()
+        if k not in names and k not in ("__dict__", "__weakref__")
+    }
+    ns["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, ns)
+
+
+def _empty_target_data() -> Dict[str, List]:
+    """Column-wise per-target readings: parallel suffix/rssi/count lists."""
+    return {"suffix": [], "rssi": [], "count": []}
+
+
+@_slotted
 @dataclass
 class StepResult:
     """Result from a single protocol step."""
@@ -30,7 +55,7 @@ class StepResult:
     # Antenna 1 results
     ant1_unique_epc_n: int = 0
     ant1_targets_seen_n: int = 0
-    ant1_target_data: List[Dict] = field(default_factory=list)
+    ant1_target_data: Dict[str, List] = field(default_factory=_empty_target_data)
     ant1_total_reads: int = 0
     ant1_rssi_min: Optional[float] = None
     ant1_rssi_max: Optional[float] = None
@@ -43,7 +68,7 @@ class StepResult:
     # Antenna 2 results  
     ant2_unique_epc_n: int = 0
     ant2_targets_seen_n: int = 0
-    ant2_target_data: List[Dict] = field(default_factory=list)
+    ant2_target_data: Dict[str, List] = field(default_factory=_empty_target_data)
     ant2_total_reads: int = 0
     ant2_rssi_min: Optional[float] = None
     ant2_rssi_max: Optional[float] = None
@@ -54,6 +79,7 @@ class StepResult:
     ant2_missed_locations: List[str] = field(default_factory=list)
 
 
+@_slotted
 @dataclass
 class TagStepResult:
     """Per-tag result for a protocol step."""
@@ -75,8 +101,12 @@ class TagStepResult:
     ant2_rssi: Optional[float] = None
     ant2_count: int = 0
     ant2_phase: Optional[float] = None
+    
+    # Beam angle of the step (None if not steered)
+    angle_deg: Optional[float] = None
 
 
+@_slotted
 @dataclass
 class UnionResult:
     """Union (aggregate) result across all steps in a repeat."""
@@ -128,6 +158,7 @@ class UnionResult:
     ant2_best_confidence: Dict[str, str] = field(default_factory=dict)
 
 
+@_slotted
 @dataclass
 class ProtocolResult:
     """Complete result from protocol execution."""
@@ -209,6 +240,8 @@ class BaseProtocol(ABC):
         self.tag_manager = tag_manager
         
         self._stop_requested = False
+        # Set alongside _stop_requested so settle/dwell waits end early
+        self._stop_event = threading.Event()
         self._progress_callback: Optional[Callable[[str, float], None]] = None
     
     def set_progress_callback(self, callback: Callable[[str, float], None]):
@@ -227,6 +260,16 @@ class BaseProtocol(ABC):
     def stop(self):
         """Request protocol to stop."""
         self._stop_requested = True
+        self._stop_event.set()
+    
+    def _clear_stop(self):
+        """Reset the stop request once a run has finished."""
+        self._stop_requested = False
+        self._stop_event.clear()
+    
+    def _wait(self, seconds: float) -> bool:
+        """Sleep for seconds; returns True early if stop() is called meanwhile."""
+        return self._stop_event.wait(seconds)
     
     @abstractmethod
     def run(self, **kwargs) -> ProtocolResult:
@@ -242,31 +285,80 @@ class BaseProtocol(ABC):
         """Split inventory data by antenna ID."""
         inv1, inv2 = {}, {}
         for epc, info in inventory.items():
-            try:
-                ant = int(info.get("antenna", 1))
-            except Exception:
-                ant = 1
-            
-            if ant == 2:
-                inv2[epc] = info
-            else:
-                inv1[epc] = info
+            # Readers report ints; accept "2" too, anything else is antenna 1
+            ant = info.get("antenna", 1)
+            (inv2 if ant == 2 or ant == "2" else inv1)[epc] = info
         
         return inv1, inv2
     
-    def _find_tag_info(self, inventory: Dict, suffix: str) -> Dict:
-        """Find tag info in inventory by suffix."""
+    @staticmethod
+    def _index_by_suffix(inventory: Dict) -> Dict[str, tuple]:
+        """Map each 4-char EPC suffix to the first (epc, info) that carries it."""
+        index = {}
         for epc, info in inventory.items():
-            if epc.endswith(suffix):
-                return {
-                    "seen": True,
-                    "epc": epc,
-                    "rssi": float(info.get("rssi", -99.0)),
-                    "count": int(info.get("count", 0)),
-                    "phase": float(info.get("phase", 0.0))
-                }
-        return {"seen": False, "epc": "", "rssi": None, "count": 0, "phase": None}
+            if len(epc) >= 4:
+                index.setdefault(epc[-4:], (epc, info))
+        return index
+    
+    @staticmethod
+    def _lookup_suffix(
+        inventory: Dict,
+        suffix: str,
+        index: Optional[Dict[str, tuple]] = None
+    ) -> Optional[tuple]:
+        """
+        Find the (epc, info) entry for suffix in inventory, or None.
+        
+        Pass index from _index_by_suffix() when looking up many tags in the same
+        inventory; 4-char suffixes are then a dict lookup instead of a scan.
+        """
+        if index is not None and len(suffix) == 4:
+            return index.get(suffix)
+        return next(((epc, info) for epc, info in inventory.items() if epc.endswith(suffix)), None)
+    
+    def _find_tag_info(
+        self,
+        inventory: Dict,
+        suffix: str,
+        index: Optional[Dict[str, tuple]] = None
+    ) -> Dict:
+        """Find tag info in inventory by suffix (see _lookup_suffix for index)."""
+        hit = self._lookup_suffix(inventory, suffix, index)
+        if hit is None:
+            return {"seen": False, "epc": "", "rssi": None, "count": 0, "phase": None}
+        epc, info = hit
+        return {
+            "seen": True,
+            "epc": epc,
+            "rssi": float(info.get("rssi", -99.0)),
+            "count": int(info.get("count", 0)),
+            "phase": float(info.get("phase", 0.0))
+        }
+    
+    def _tag_reading(
+        self,
+        inventory: Dict,
+        suffix: str,
+        index: Optional[Dict[str, tuple]] = None
+    ) -> tuple:
+        """
+        Get (seen, rssi, count, phase) for suffix.
+        
+        Tuple form of _find_tag_info for per-tag loops that unpack the values
+        straight into a TagStepResult.
+        """
+        hit = self._lookup_suffix(inventory, suffix, index)
+        if hit is None:
+            return False, None, 0, None
+        info = hit[1]
+        return True, float(info.get("rssi", -99.0)), int(info.get("count", 0)), float(info.get("phase", 0.0))
     
     def _get_timestamp(self) -> str:
-        """Get current timestamp string."""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        """Get current timestamp string (local time, millisecond precision)."""
+        sec, ns = divmod(time.time_ns(), 1_000_000_000)
+        return f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))}.{ns // 1_000_000:03d}"
+    
+    def _new_run_id(self) -> str:
+        """Get a unique run ID: compact local timestamp plus 8 random hex digits."""
+        sec, ns = divmod(time.time_ns(), 1_000_000_000)
+        return f"{time.strftime('%Y%m%d_%H%M%S', time.localtime(sec))}.{ns // 1_000_000:03d}_{os.urandom(4).hex()}"
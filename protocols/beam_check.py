@@ -4,14 +4,15 @@ Beam Check Protocol.
 Quick beam verification protocol to ensure beam steering is working.
 """
 
-import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
+from statistics import fmean
 from datetime import datetime
 
-from .base import BaseProtocol
+from .base import BaseProtocol, _slotted
 
 
+@_slotted
 @dataclass
 class BeamCheckResult:
     """Result from beam check."""
@@ -86,26 +87,31 @@ class BeamCheckProtocol(BaseProtocol):
         presets = self.lut.get_beam_presets(port_config)
         
         try:
-            # Check LEFT
-            self._update_progress("Checking LEFT beam...", 0.2)
-            result.left_angle = presets["LEFT"]
-            result.left_rssi, result.left_reads = self._measure_beam(
-                presets["LEFT"], port_config, dwell_s, active_antennas
-            )
+            # Resolve all three beam voltages before the first measurement
+            voltages = {
+                name: self.lut.get_voltages(port_config, presets[name])
+                for name in ("LEFT", "CENTER", "RIGHT")
+            }
             
-            # Check CENTER
-            self._update_progress("Checking CENTER beam...", 0.5)
-            result.center_angle = presets["CENTER"]
-            result.center_rssi, result.center_reads = self._measure_beam(
-                presets["CENTER"], port_config, dwell_s, active_antennas
-            )
+            # Check LEFT, CENTER, RIGHT; presets that resolve to the same
+            # voltages are the same physical beam, so measure it only once
+            measured = {}
+            by_voltage = {}
+            for name, fraction in (("LEFT", 0.2), ("CENTER", 0.5), ("RIGHT", 0.8)):
+                self._update_progress(f"Checking {name} beam...", fraction)
+                v = voltages[name]
+                if v not in by_voltage:
+                    by_voltage[v] = self._measure_beam(v, dwell_s, active_antennas)
+                    if by_voltage[v] is None:
+                        raise RuntimeError("Beam check stopped")
+                measured[name] = by_voltage[v]
             
-            # Check RIGHT
-            self._update_progress("Checking RIGHT beam...", 0.8)
+            result.left_angle = presets["LEFT"]
+            result.left_rssi, result.left_reads = measured["LEFT"]
+            result.center_angle = presets["CENTER"]
+            result.center_rssi, result.center_reads = measured["CENTER"]
             result.right_angle = presets["RIGHT"]
-            result.right_rssi, result.right_reads = self._measure_beam(
-                presets["RIGHT"], port_config, dwell_s, active_antennas
-            )
+            result.right_rssi, result.right_reads = measured["RIGHT"]
             
             # Calculate metrics
             result.beam_spread = abs(result.left_rssi - result.right_rssi)
@@ -118,9 +124,9 @@ class BeamCheckProtocol(BaseProtocol):
                 result.beam_symmetry = 1.0
             
             # Basic steering check: should see RSSI variation
-            rssi_values = [result.left_rssi, result.center_rssi, result.right_rssi]
-            rssi_range = max(rssi_values) - min(rssi_values)
-            result.is_steering_ok = rssi_range > 1.0 and all(r > -90 for r in rssi_values)
+            lo = min(result.left_rssi, result.center_rssi, result.right_rssi)
+            hi = max(result.left_rssi, result.center_rssi, result.right_rssi)
+            result.is_steering_ok = hi - lo > 1.0 and lo > -90
             
             self._update_progress("Beam check complete", 1.0)
             result.success = True
@@ -131,42 +137,50 @@ class BeamCheckProtocol(BaseProtocol):
         
         # Reset beam
         self.mcu.set_voltage(0, 0)
+        self._clear_stop()
         
         return result
     
     def _measure_beam(
         self,
-        angle: float,
-        port_config: int,
+        voltages: Tuple[float, float],
         dwell_s: float,
         active_antennas: List[int]
-    ) -> tuple:
-        """Measure RSSI at given beam angle."""
+    ) -> Optional[tuple]:
+        """
+        Measure RSSI with the beam steered by the given (v_ch1, v_ch2).
+        
+        Returns (avg_rssi, read_count), or None if stop() cut the wait short.
+        """
         
         # Apply beam
-        v1, v2 = self.lut.get_voltages(port_config, angle)
+        v1, v2 = voltages
         self.mcu.set_voltage(v1, v2)
-        time.sleep(0.3)  # Settle
+        if self._wait(0.3):  # Settle
+            return None
         
         # Collect
         self.reader.clear_data()
-        time.sleep(dwell_s)
+        if self._wait(dwell_s):
+            return None
         inventory = self.reader.get_all_data()
         
         # Calculate average RSSI for target antenna
         rssi_values = []
         read_count = 0
+        suffix_set = self.tag_manager.suffix_set
+        active = frozenset(active_antennas)
         
         for epc, info in inventory.items():
             suffix = epc[-4:] if len(epc) >= 4 else ""
-            if suffix not in self.tag_manager.suffixes:
+            if suffix not in suffix_set:
                 continue
             
             ant = info.get("antenna", 1)
-            if ant in active_antennas:
+            if ant in active:
                 rssi_values.append(info.get("rssi", -99))
                 read_count += info.get("count", 1)
         
-        avg_rssi = sum(rssi_values) / len(rssi_values) if rssi_values else -99.0
+        avg_rssi = fmean(rssi_values) if rssi_values else -99.0
         
         return avg_rssi, read_count
@@ -5,14 +5,16 @@ This protocol sweeps through angle ranges collecting RSSI data
 for LUT calibration and beam characterization.
 """
 
+import math
 import time
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from .base import BaseProtocol, ProtocolResult
+from .base import BaseProtocol, ProtocolResult, _slotted
 
 
+@_slotted
 @dataclass
 class CalibrationPoint:
     """Single calibration measurement point."""
@@ -32,6 +34,7 @@ class CalibrationPoint:
     ant2_read_count: int = 0
 
 
+@_slotted
 @dataclass
 class CalibrationResult:
     """Complete calibration sweep result."""
@@ -105,16 +108,29 @@ class CalibrationSweepProtocol(BaseProtocol):
             result.error_message = "Reader not connected"
             return result
         
-        # Generate angle list
-        angles = []
-        angle = angle_start
-        while angle <= angle_end:
-            angles.append(angle)
-            angle += angle_step
+        if angle_step <= 0:
+            result.success = False
+            result.error_message = "Angle step must be positive"
+            return result
+        
+        # Generate angle list from start in whole steps up to end (each angle
+        # computed from its index so repeated += cannot drift past the end)
+        n_angles = max(0, math.floor((angle_end - angle_start) / angle_step + 1e-9) + 1)
+        angles = [angle_start + i * angle_step for i in range(n_angles)]
         
         total = len(angles)
         
         try:
+            # Beam voltages for the whole sweep, resolved up front
+            voltages = [self.lut.get_voltages(port_config, a) for a in angles]
+            
+            # Two-stage pipeline: once a point's inventory is captured the
+            # next beam is applied, so its settle time runs while the current
+            # point is reduced; only the remainder is slept off
+            if angles:
+                self.mcu.set_voltage(*voltages[0])
+            settle_until = time.monotonic() + 0.5
+            
             for idx, target_angle in enumerate(angles):
                 if self._stop_requested:
                     break
@@ -122,16 +138,23 @@ class CalibrationSweepProtocol(BaseProtocol):
                 progress = (idx + 1) / total
                 self._update_progress(f"Angle {target_angle:.1f}° ({idx+1}/{total})", progress)
                 
-                # Apply beam
-                v1, v2 = self.lut.get_voltages(port_config, target_angle)
-                self.mcu.set_voltage(v1, v2)
-                time.sleep(0.5)  # Settle
+                # Beam was applied at the end of the previous step; settle
+                v1, v2 = voltages[idx]
+                remaining = settle_until - time.monotonic()
+                if remaining > 0 and self._wait(remaining):
+                    break
                 
-                # Collect
+                # Collect (a stop during the dwell drops the partial point)
                 self.reader.clear_data()
-                time.sleep(dwell_s)
+                if self._wait(dwell_s):
+                    break
                 inventory = self.reader.get_all_data()
                 
+                # Apply next beam before reducing this one
+                if idx + 1 < total:
+                    self.mcu.set_voltage(*voltages[idx + 1])
+                    settle_until = time.monotonic() + 0.5
+                
                 # Calculate stats
                 point = self._calculate_point(
                     target_angle, v1, v2, port_config, 
@@ -158,7 +181,7 @@ class CalibrationSweepProtocol(BaseProtocol):
         
         # Reset beam
         self.mcu.set_voltage(0, 0)
-        self._stop_requested = False
+        self._clear_stop()
         
         return result
     
@@ -180,36 +203,53 @@ class CalibrationSweepProtocol(BaseProtocol):
             port_config=port_config
         )
         
-        # Split by antenna
-        ant1_rssi, ant2_rssi = [], []
+        # Split by antenna; each report stands for count reads at its RSSI,
+        # so keep count-weighted running stats instead of expanding lists
+        ant1_sum, ant1_n, ant1_min, ant1_max = 0.0, 0, math.inf, -math.inf
+        ant2_sum, ant2_n, ant2_min, ant2_max = 0.0, 0, math.inf, -math.inf
+        ant1_active = 1 in active_antennas
+        ant2_active = 2 in active_antennas
+        suffix_set = self.tag_manager.suffix_set
         
         for epc, info in inventory.items():
             # Only count known tags
             suffix = epc[-4:] if len(epc) >= 4 else ""
-            if suffix not in self.tag_manager.suffixes:
+            if suffix not in suffix_set:
                 continue
             
+            count = info.get("count", 1)
+            if count <= 0:
+                continue
             rssi = info.get("rssi", -99)
             ant = info.get("antenna", 1)
-            count = info.get("count", 1)
             
-            if ant == 1 and 1 in active_antennas:
-                ant1_rssi.extend([rssi] * count)
-            elif ant == 2 and 2 in active_antennas:
-                ant2_rssi.extend([rssi] * count)
+            if ant == 1 and ant1_active:
+                ant1_sum += rssi * count
+                ant1_n += count
+                if rssi < ant1_min:
+                    ant1_min = rssi
+                if rssi > ant1_max:
+                    ant1_max = rssi
+            elif ant == 2 and ant2_active:
+                ant2_sum += rssi * count
+                ant2_n += count
+                if rssi < ant2_min:
+                    ant2_min = rssi
+                if rssi > ant2_max:
+                    ant2_max = rssi
         
         # Calculate ant1 stats
-        if ant1_rssi:
-            point.ant1_rssi_avg = sum(ant1_rssi) / len(ant1_rssi)
-            point.ant1_rssi_min = min(ant1_rssi)
-            point.ant1_rssi_max = max(ant1_rssi)
-            point.ant1_read_count = len(ant1_rssi)
+        if ant1_n:
+            point.ant1_rssi_avg = ant1_sum / ant1_n
+            point.ant1_rssi_min = ant1_min
+            point.ant1_rssi_max = ant1_max
+            point.ant1_read_count = ant1_n
         
         # Calculate ant2 stats
-        if ant2_rssi:
-            point.ant2_rssi_avg = sum(ant2_rssi) / len(ant2_rssi)
-            point.ant2_rssi_min = min(ant2_rssi)
-            point.ant2_rssi_max = max(ant2_rssi)
-            point.ant2_read_count = len(ant2_rssi)
+        if ant2_n:
+            point.ant2_rssi_avg = ant2_sum / ant2_n
+            point.ant2_rssi_min = ant2_min
+            point.ant2_rssi_max = ant2_max
+            point.ant2_read_count = ant2_n
         
         return point
@@ -5,13 +5,14 @@ This module implements a simple inventory collection protocol
 without beam steering (for Ant2-only mode).
 """
 
-import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dataclasses import dataclass, field
+from statistics import fmean
 
-from .base import BaseProtocol, ProtocolResult
+from .base import BaseProtocol, ProtocolResult, StepResult, TagStepResult, UnionResult, _slotted
 
 
+@_slotted
 @dataclass
 class SimpleInventoryResult:
     """Result from simple inventory collection."""
@@ -67,8 +68,7 @@ class SimpleInventoryProtocol(BaseProtocol):
         ant2_enabled = 2 in active_antennas
         
         # Generate unique run ID
-        import uuid
-        run_id = f"{self._get_timestamp().replace(':', '').replace('-', '').replace(' ', '_')}_{uuid.uuid4().hex[:8]}"
+        run_id = self._new_run_id()
         
         # Validation errors list
         validation_errors = []
@@ -86,8 +86,8 @@ class SimpleInventoryProtocol(BaseProtocol):
             active_antennas=active_antennas,
             tie_break_rule="NONE",
             # Target configuration
-            targets_configured_suffixes=self.tag_manager.suffixes.copy(),
-            targets_configured_labels=[t.label for t in self.tag_manager.tags],
+            targets_configured_suffixes=self.tag_manager.suffixes,
+            targets_configured_labels=self.tag_manager.labels,
             # Hardware status
             mcu_connected=False,  # Simple inventory doesn't use MCU
             reader_connected=self.reader.connected if self.reader else False,
@@ -122,9 +122,41 @@ class SimpleInventoryProtocol(BaseProtocol):
                     dwell_s=dwell_s,
                     active_antennas=active_antennas
                 )
+                if inv_result is None:
+                    break  # stopped mid-dwell
+                
+                # --- One pass over tag details: seen set plus UnionResult stats ---
+                seen_suffixes = set()
+                ant2_best_beam = {}
+                ant2_best_rssi = {}
+                ant2_seen_beams_n = {}
+                ant2_best_margin = {}
+                ant2_tie_flag = {}
+                ant2_best_confidence = {}
+                
+                if ant2_enabled:
+                    for detail in inv_result.tag_details:
+                        suffix = detail["suffix"]
+                        if detail["seen"]:
+                            seen_suffixes.add(suffix)
+                            ant2_best_beam[suffix] = "OMNI"
+                            ant2_best_rssi[suffix] = detail["rssi"]
+                            ant2_seen_beams_n[suffix] = 1
+                            ant2_best_margin[suffix] = None  # Single beam
+                            ant2_tie_flag[suffix] = 0
+                            ant2_best_confidence[suffix] = "SINGLE"
+                        else:
+                            ant2_seen_beams_n[suffix] = 0
+                            ant2_best_confidence[suffix] = "NONE"
+                else:
+                    seen_suffixes.update(d["suffix"] for d in inv_result.tag_details if d["seen"])
+                
+                # Seen/missed tags, computed once and shared by step and union
+                missed_tags = self.tag_manager.get_missed_tags(seen_suffixes)
+                missed_suffixes = [t.suffix for t in missed_tags]
+                missed_labels = [t.label for t in missed_tags]
                 
                 # --- Create StepResult ---
-                from .base import StepResult, TagStepResult
                 
                 # Calculate nontargets
                 ant2_targets_seen_n = inv_result.tags_seen
@@ -134,6 +166,9 @@ class SimpleInventoryProtocol(BaseProtocol):
                     timestamp=inv_result.timestamp,
                     beam_state="OMNI",
                     angle_deg=0.0,
+                    port_config=0,  # No beam steering
+                    v_ch1=0.0,
+                    v_ch2=0.0,
                     dwell_s=dwell_s,
                     active_antennas=active_antennas,
                     tags_total=self.tag_manager.count,
@@ -145,14 +180,14 @@ class SimpleInventoryProtocol(BaseProtocol):
                     ant2_rssi_max=inv_result.rssi_max,
                     ant2_rssi_avg=inv_result.rssi_avg,
                     # Simple inventory misses
-                    ant2_missed_suffixes=[t.suffix for t in self.tag_manager.get_missed_tags([self.tag_manager.get_tag(d["suffix"]) for d in inv_result.tag_details if d["seen"]])],
-                    ant2_missed_labels=[t.label for t in self.tag_manager.get_missed_tags([self.tag_manager.get_tag(d["suffix"]) for d in inv_result.tag_details if d["seen"]])]
+                    ant2_missed_suffixes=missed_suffixes,
+                    ant2_missed_labels=missed_labels
                 )
                 result.step_results.append(step)
                 
-                # --- Create TagStepResults ---
-                for detail in inv_result.tag_details:
-                    ts = TagStepResult(
+                # --- Create TagStepResults (one extend per repeat) ---
+                result.tag_step_results.extend(
+                    TagStepResult(
                         timestamp=inv_result.timestamp,
                         beam_state="OMNI",
                         active_antennas=active_antennas,
@@ -166,42 +201,10 @@ class SimpleInventoryProtocol(BaseProtocol):
                         ant2_phase=detail.get("phase"),
                         angle_deg=0.0
                     )
-                    result.tag_step_results.append(ts)
-                
-                # --- Process tag details for UnionResult ---
-                ant2_best_beam = {}
-                ant2_best_rssi = {}
-                ant2_seen_beams_n = {}
-                ant2_best_margin = {}
-                ant2_tie_flag = {}
-                ant2_best_confidence = {}
-                
-                seen_tags = []
-                
-                for detail in inv_result.tag_details:
-                    suffix = detail["suffix"]
-                    if detail["seen"]:
-                        seen_tags.append(self.tag_manager.get_tag(suffix))
-                        
-                        # Populate Ant2 stats (assuming Ant2 active)
-                        if ant2_enabled:
-                            ant2_best_beam[suffix] = "OMNI"
-                            ant2_best_rssi[suffix] = detail["rssi"]
-                            ant2_seen_beams_n[suffix] = 1
-                            ant2_best_margin[suffix] = None  # Single beam
-                            ant2_tie_flag[suffix] = 0
-                            ant2_best_confidence[suffix] = "SINGLE"
-                    else:
-                        # Not seen
-                        if ant2_enabled:
-                            ant2_seen_beams_n[suffix] = 0
-                            ant2_best_confidence[suffix] = "NONE"
-                
-                # Missed tags calculation
-                ant2_missed_tags = self.tag_manager.get_missed_tags(seen_tags) if ant2_enabled else []
+                    for detail in inv_result.tag_details
+                )
                 
                 # Store in results
-                from .base import UnionResult
                 union = UnionResult(
                     timestamp=inv_result.timestamp,
                     repeat=repeat,
@@ -212,8 +215,8 @@ class SimpleInventoryProtocol(BaseProtocol):
                     ant2_unique_epcs=inv_result.tags_seen,
                     ant2_targets_seen=inv_result.tags_seen,
                     # Missed tags
-                    ant2_missed_suffixes=[t.suffix for t in ant2_missed_tags],
-                    ant2_missed_labels=[t.label for t in ant2_missed_tags],
+                    ant2_missed_suffixes=missed_suffixes if ant2_enabled else [],
+                    ant2_missed_labels=missed_labels if ant2_enabled else [],
                     # Per-tag stats
                     ant2_best_beam=ant2_best_beam,
                     ant2_best_rssi=ant2_best_rssi,
@@ -232,7 +235,7 @@ class SimpleInventoryProtocol(BaseProtocol):
             result.error_message = str(e)
             result.end_time = self._get_timestamp()
         
-        self._stop_requested = False
+        self._clear_stop()
         return result
     
     def _collect_inventory(
@@ -240,11 +243,12 @@ class SimpleInventoryProtocol(BaseProtocol):
         repeat: int,
         dwell_s: float,
         active_antennas: List[int]
-    ) -> SimpleInventoryResult:
-        """Collect single inventory."""
+    ) -> Optional[SimpleInventoryResult]:
+        """Collect single inventory (None if stopped during the dwell)."""
         
         self.reader.clear_data()
-        time.sleep(dwell_s)
+        if self._wait(dwell_s):
+            return None
         inventory = self.reader.get_all_data()
         
         # Filter by active antenna
@@ -259,23 +263,25 @@ class SimpleInventoryProtocol(BaseProtocol):
         total_reads = 0
         tags_seen = 0
         
-        for tag in self.tag_manager.tags:
-            tag_info = self._find_tag_info(inventory, tag.suffix)
+        index = self._index_by_suffix(inventory)
+        columns = self.tag_manager.columns
+        for suffix, label, location in zip(columns.suffixes, columns.labels, columns.locations):
+            seen, rssi, count, phase = self._tag_reading(inventory, suffix, index)
             
             detail = {
-                "label": tag.label,
-                "suffix": tag.suffix,
-                "location": tag.location,
-                "seen": tag_info["seen"]
+                "label": label,
+                "suffix": suffix,
+                "location": location,
+                "seen": seen
             }
             
-            if tag_info["seen"]:
-                detail["rssi"] = tag_info["rssi"]
-                detail["count"] = tag_info["count"]
-                detail["phase"] = tag_info["phase"]
+            if seen:
+                detail["rssi"] = rssi
+                detail["count"] = count
+                detail["phase"] = phase
                 
-                all_rssi.append(tag_info["rssi"])
-                total_reads += tag_info["count"]
+                all_rssi.append(rssi)
+                total_reads += count
                 tags_seen += 1
             
             tag_details.append(detail)
@@ -283,7 +289,7 @@ class SimpleInventoryProtocol(BaseProtocol):
         # Calculate aggregates
         rssi_min = min(all_rssi) if all_rssi else 0.0
         rssi_max = max(all_rssi) if all_rssi else 0.0
-        rssi_avg = sum(all_rssi) / len(all_rssi) if all_rssi else 0.0
+        rssi_avg = fmean(all_rssi) if all_rssi else 0.0
         
         return SimpleInventoryResult(
             timestamp=self._get_timestamp(),
@@ -2,7 +2,7 @@
 Utility functions for AFSUAM Measurement System.
 """
 
-from .csv_exporter import CSVExporter
+from .csv_exporter import CSVExporter, SnapshotStream
 from .logging import Logger
 
-__all__ = ['CSVExporter', 'Logger']
+__all__ = ['CSVExporter', 'SnapshotStream', 'Logger']
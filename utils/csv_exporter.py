@@ -1,16 +1,81 @@
 """
 CSV Export Utilities for AFSUAM Measurement System.
 
-Supports multiple export formats: CSV, JSON, Excel.
+Supports multiple export formats: CSV (optionally zstd-compressed),
+JSON/NDJSON, Excel, Parquet/Feather.
 """
 
 import csv
+import io
+import itertools
 import json
+import os
+import re
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 from protocols.base import ProtocolResult
+from utils.logging import Logger
+
+# Optional backends (openpyxl, xlsxwriter, pyarrow, orjson, zstandard)
+# are imported inside the export path that uses them, so creating an
+# exporter at GUI startup costs only stdlib imports.
+
+
+# Characters that make csv.writer quote a cell (default dialect)
+_CSV_SPECIAL = re.compile(r'[",\r\n]')
+
+# Preformatted one-decimal strings for integral values. Reader RSSI is
+# whole dBm, so most RSSI cells become a dict hit instead of a format call.
+_FMT1_LUT = {i: f"{i:.1f}" for i in range(-128, 361)}
+
+
+def _fmt1(x) -> str:
+    """Format like f"{x:.1f}", with "" for None."""
+    if x is None:
+        return ""
+    s = _FMT1_LUT.get(x)
+    return s if s is not None else f"{x:.1f}"
+
+
+# "1|2"-style strings per antenna combination; only a handful ever exist
+_ANTENNAS_STR: Dict[tuple, str] = {}
+
+
+def _join_antennas(antennas) -> str:
+    """Join antenna ports with "|" (cached per combination)."""
+    key = tuple(antennas)
+    s = _ANTENNAS_STR.get(key)
+    if s is None:
+        s = _ANTENNAS_STR[key] = "|".join(str(a) for a in key)
+    return s
+
+
+@contextmanager
+def _atomic_write(filepath: Path):
+    """
+    Yield a temp path next to filepath; move it into place on success.
+    
+    A crash or error mid-export leaves any previous file untouched and
+    no truncated output behind.
+    """
+    tmp = filepath.with_name(filepath.name + ".tmp")
+    try:
+        yield tmp
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    os.replace(tmp, filepath)
+
+
+# Filename sanitizing (see CSVExporter._sanitize_name)
+_NAME_SPECIAL = re.compile(r'[^\w\-]')
+_NAME_UNDERSCORES = re.compile(r'_+')
 
 
 class CSVExporter:
@@ -18,9 +83,10 @@ class CSVExporter:
     Exports protocol results to multiple formats.
     
     Supported formats:
-    - CSV (default)
-    - JSON
-    - Excel (requires openpyxl)
+    - CSV (default; "csv.zst" compresses on the fly, requires zstandard)
+    - JSON / NDJSON (faster with orjson)
+    - Excel (requires xlsxwriter or openpyxl)
+    - Parquet / Feather / Arrow IPC (requires pandas + pyarrow)
     """
     
     # STEP record headers - comprehensive with all stats
@@ -65,32 +131,75 @@ class CSVExporter:
         "ant2_tie_flag_per_tag", "ant2_best_confidence_per_tag"
     ]
     
-    def __init__(self, output_dir: str = "outputs"):
+    # Section marker + header lines, preformatted as csv.writer would
+    # write them (headers are plain ASCII, no quoting)
+    STEP_SECTION = "# STEP_ROWS\r\n" + ",".join(STEP_HEADERS) + "\r\n"
+    TAGSTEP_SECTION = "# TAGSTEP_ROWS\r\n" + ",".join(TAGSTEP_HEADERS) + "\r\n"
+    UNION_SECTION = "# UNION_ROWS\r\n" + ",".join(UNION_HEADERS) + "\r\n"
+    
+    # Live snapshot CSV headers
+    SNAPSHOT_HEADERS = [
+        "timestamp", "epc", "suffix", "count", "rssi",
+        "phase", "doppler", "antenna",
+        "port_config", "angle_deg", "v_ch1", "v_ch2"
+    ]
+    
+    # Rows buffered before each batched write in CSV export
+    ROW_CHUNK_SIZE = 1000
+    
+    # File buffer size for CSV/JSON export
+    WRITE_BUFFER_SIZE = 4 << 20
+    
+    def __init__(
+        self,
+        output_dir: str = "outputs",
+        write_buffer_size: Optional[int] = None,
+        logger: Optional[Logger] = None
+    ):
         """
         Initialize exporter.
         
         Args:
             output_dir: Base directory for output files
+            write_buffer_size: File buffer size in bytes for exports
+                (default WRITE_BUFFER_SIZE); smaller values trade
+                throughput for lower memory on constrained machines
+            logger: Receives export status messages and fallback
+                warnings (default: print to stdout)
         """
+        self._logger = logger
+        if write_buffer_size is not None:
+            self.WRITE_BUFFER_SIZE = write_buffer_size
         self.base_output_dir = Path(output_dir)
         self.base_output_dir.mkdir(parents=True, exist_ok=True)
         # For backward compatibility
         self.output_dir = self.base_output_dir
+        # Last date folder created by _get_date_folder
+        self._date_folder: Optional[Path] = None
+    
+    def _log(self, message: str, level: str = "INFO"):
+        """Forward a status message to the logger, or print it."""
+        if self._logger:
+            self._logger.log(message, level)
+        else:
+            print(message)
     
     def _sanitize_name(self, name: str) -> str:
         """Sanitize name for use in filename."""
         # Replace spaces and special chars with underscores
-        import re
-        sanitized = re.sub(r'[^\w\-]', '_', name)
+        sanitized = _NAME_SPECIAL.sub('_', name)
         # Remove multiple underscores
-        sanitized = re.sub(r'_+', '_', sanitized)
+        sanitized = _NAME_UNDERSCORES.sub('_', sanitized)
         return sanitized.strip('_')
     
-    def _get_date_folder(self) -> Path:
+    def _get_date_folder(self, now: Optional[datetime] = None) -> Path:
         """Get date-based output folder, creating if needed."""
-        date_str = datetime.now().strftime("%Y-%m-%d")
+        date_str = (now or datetime.now()).strftime("%Y-%m-%d")
         date_folder = self.base_output_dir / date_str
-        date_folder.mkdir(parents=True, exist_ok=True)
+        # Only touch the filesystem once per day folder
+        if date_folder != self._date_folder:
+            date_folder.mkdir(parents=True, exist_ok=True)
+            self._date_folder = date_folder
         return date_folder
     
     def generate_filename(
@@ -115,14 +224,16 @@ class CSVExporter:
         Example:
             outputs/2026-01-07/AFSUAM_TestBed_PhasedArray_LCR_130736.csv
         """
-        date_folder = self._get_date_folder()
+        # One clock read so folder date and time stamp always agree
+        now = datetime.now()
+        date_folder = self._get_date_folder(now)
         
         # Sanitize names
         station = self._sanitize_name(station_name)
         ref_ant = self._sanitize_name(ref_antenna_name)
         
         # Generate timestamp
-        timestamp = datetime.now().strftime("%H%M%S")
+        timestamp = now.strftime("%H%M%S")
         
         # Build filename
         filename = f"{station}_{ref_ant}_{mode}_{timestamp}.{format}"
@@ -142,7 +253,8 @@ class CSVExporter:
         Args:
             result: ProtocolResult to export
             filename: Output filename (auto-generated if None)
-            format: Export format ("csv", "json", "excel")
+            format: Export format ("csv", "csv.zst", "json", "ndjson", "excel",
+                "parquet", "feather", "arrow")
             metadata: Additional metadata to include
         
         Returns:
@@ -157,8 +269,12 @@ class CSVExporter:
         
         if format == "json":
             return self._export_json(result, filepath, metadata)
+        elif format == "ndjson":
+            return self._export_ndjson(result, filepath, metadata)
         elif format == "excel":
             return self._export_excel(result, filepath, metadata)
+        elif format in ("parquet", "feather", "arrow"):
+            return self._export_parquet(result, filepath, metadata)
         else:
             return self._export_csv(result, filepath, metadata)
     
@@ -189,21 +305,22 @@ class CSVExporter:
         ext = filepath.suffix.lower()
         if ext == ".json":
             return self._export_json(result, filepath, metadata)
+        elif ext in [".ndjson", ".jsonl"]:
+            return self._export_ndjson(result, filepath, metadata)
         elif ext in [".xlsx", ".xls"]:
             return self._export_excel(result, filepath, metadata)
+        elif ext in [".parquet", ".feather", ".arrow"]:
+            return self._export_parquet(result, filepath, metadata)
         else:
             return self._export_csv(result, filepath, metadata)
     
-    def _export_csv(
+    def _run_metadata(
         self,
         result: ProtocolResult,
-        filepath: Path,
         metadata: Optional[Dict] = None
-    ) -> str:
-        """Export to CSV format with comprehensive metadata."""
-        
-        # Build comprehensive RUN_METADATA
-        run_metadata = {
+    ) -> Dict[str, Any]:
+        """Build the comprehensive RUN_METADATA block shared by CSV and Parquet."""
+        return {
             # Basic info
             "export_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "station": result.station_name,
@@ -220,7 +337,7 @@ class CSVExporter:
             "protocol_repeats": result.protocol_repeats,
             "port_config": result.port_config,
             "beam_sequence": result.beam_sequence,
-            "active_antennas": "|".join(str(a) for a in result.active_antennas),
+            "active_antennas": _join_antennas(result.active_antennas),
             "tie_break_rule": result.tie_break_rule,
             # Target configuration
             "targets_configured_suffixes": "|".join(result.targets_configured_suffixes),
@@ -239,217 +356,511 @@ class CSVExporter:
             # Additional user metadata
             **(metadata or {})
         }
+    
+    def _export_csv(
+        self,
+        result: ProtocolResult,
+        filepath: Path,
+        metadata: Optional[Dict] = None
+    ) -> str:
+        """Export to CSV format with comprehensive metadata."""
+        zstd = None
+        if filepath.suffix.lower() == ".zst":
+            try:
+                import zstandard as zstd
+            except ImportError:
+                # Fallback to plain CSV if zstandard not available
+                self._log("zstandard not available, writing uncompressed CSV", "WARNING")
+                filepath = filepath.with_suffix("")
         
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
+        run_metadata = self._run_metadata(result, metadata)
+        
+        # Row cells only need quoting if user-supplied text does; check once
+        plain = self._is_plain_csv_text(result)
+        
+        with _atomic_write(filepath) as tmp, self._open_csv(tmp, zstd) as f:
             writer = csv.writer(f)
             
-            # Write metadata block
-            writer.writerow(["# RUN_METADATA"])
-            for key, value in run_metadata.items():
-                writer.writerow([f"# {key}", value])
-            writer.writerow([])
+            # Write metadata block (usually plain text -> one f.write)
+            banner = [["# RUN_METADATA"]]
+            banner.extend([f"# {key}", value] for key, value in run_metadata.items())
+            banner.append([])
+            banner_plain = _CSV_SPECIAL.search(
+                "".join(["" if c is None else str(c) for row in banner for c in row])
+            ) is None
+            self._write_rows_chunked(f, writer, banner_plain, banner)
             
             # Write step results with full stats
             if result.step_results:
-                writer.writerow(["# STEP_ROWS"])
-                writer.writerow(self.STEP_HEADERS)
-                for i, step in enumerate(result.step_results):
-                    # Calculate repeat number
-                    repeat_num = (i // 3) + 1 if len(result.step_results) >= 3 else 1
-                    row = self._step_to_row(step, result, repeat_num)
-                    writer.writerow(row)
-                writer.writerow([])
+                f.write(self.STEP_SECTION)
+                self._write_rows_chunked(f, writer, plain, self._step_rows(result))
+                f.write("\r\n")
             
             # Write tag step results - clean format
             if result.tag_step_results:
-                writer.writerow(["# TAGSTEP_ROWS"])
-                writer.writerow(self.TAGSTEP_HEADERS)
-                for i, ts in enumerate(result.tag_step_results):
-                    # Calculate repeat based on position
-                    tags_per_step = len(result.tag_step_results) // max(len(result.step_results), 1)
-                    repeat_num = (i // (tags_per_step * 3)) + 1 if tags_per_step > 0 else 1
-                    row = self._tagstep_to_row(ts, result, repeat_num)
-                    writer.writerow(row)
-                writer.writerow([])
+                f.write(self.TAGSTEP_SECTION)
+                self._write_rows_chunked(f, writer, plain, self._tagstep_rows(result))
+                f.write("\r\n")
             
             # Write union results with best beam
             if result.union_results:
-                writer.writerow(["# UNION_ROWS"])
-                writer.writerow(self.UNION_HEADERS)
-                for union in result.union_results:
-                    row = self._union_to_row(union, result)
-                    writer.writerow(row)
+                f.write(self.UNION_SECTION)
+                self._write_rows_chunked(f, writer, plain, self._union_rows(result))
         
-        print(f"Exported CSV: {filepath}")
+        self._log(f"Exported CSV: {filepath}")
         return str(filepath)
     
+    @staticmethod
+    def _is_plain_csv_text(result: ProtocolResult) -> bool:
+        """
+        Check that no free text in result's rows needs CSV quoting.
+        
+        Everything else in a row is a number, a generated timestamp/ID or
+        a "|"-joined list of the texts checked here.
+        """
+        texts = [result.station_name, result.ref_antenna_name, result.run_id, result.beam_sequence]
+        texts += result.targets_configured_suffixes
+        texts += result.targets_configured_labels
+        texts += {
+            text
+            for ts in result.tag_step_results
+            for text in (ts.tag_label, ts.tag_suffix, ts.tag_location, ts.beam_state)
+        }
+        for rec in (*result.step_results, *result.union_results):
+            texts += rec.ant1_missed_labels
+            texts += rec.ant2_missed_labels
+            texts += rec.ant1_missed_suffixes
+            texts += rec.ant2_missed_suffixes
+        return _CSV_SPECIAL.search("".join(texts)) is None
+    
+    def _open_csv(self, filepath: Path, zstd=None):
+        """
+        Open a CSV export file for text writing.
+        
+        When given the zstandard module the text is compressed (level 1,
+        all cores) on its way to disk; level 1 keeps compression from
+        becoming the bottleneck while still shrinking the numeric CSV
+        several times.
+        """
+        if zstd is None:
+            return open(filepath, "w", newline="", encoding="utf-8", buffering=self.WRITE_BUFFER_SIZE)
+        
+        cctx = zstd.ZstdCompressor(level=1, threads=-1)
+        raw = open(filepath, "wb")
+        stream = io.BufferedWriter(cctx.stream_writer(raw), buffer_size=self.WRITE_BUFFER_SIZE)
+        return io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    
+    def _write_rows_chunked(self, f, writer, plain: bool, rows) -> None:
+        """
+        Write rows in ROW_CHUNK_SIZE batches through one reused buffer.
+        
+        With plain=True no cell can need quoting, so each batch is joined
+        into CSV text directly (None -> "", like csv.writer) and written
+        with one f.write(), skipping csv.writer's per-cell checks.
+        """
+        buf = []
+        append = buf.append
+        chunk = self.ROW_CHUNK_SIZE
+        if not plain:
+            for row in rows:
+                append(row)
+                if len(buf) >= chunk:
+                    writer.writerows(buf)
+                    buf.clear()
+            if buf:
+                writer.writerows(buf)
+            return
+        
+        for row in rows:
+            append(",".join(["" if c is None else str(c) for c in row]))
+            if len(buf) >= chunk:
+                append("")
+                f.write("\r\n".join(buf))
+                buf.clear()
+        if buf:
+            append("")
+            f.write("\r\n".join(buf))
+    
     def _export_json(
         self,
         result: ProtocolResult,
         filepath: Path,
         metadata: Optional[Dict] = None
     ) -> str:
-        """Export to JSON format."""
+        """Export to JSON format (uses orjson when available)."""
         data = {
-            "metadata": {
-                "export_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "station": result.station_name,
-                "ref_antenna": result.ref_antenna_name,
-                "start_time": result.start_time,
-                "end_time": result.end_time,
-                "success": result.success,
-                "protocol_dwell_s": result.protocol_dwell_s,
-                "protocol_repeats": result.protocol_repeats,
-                "port_config": result.port_config,
-                "beam_sequence": result.beam_sequence,
-                "active_antennas": result.active_antennas,
-                "mcu_connected": result.mcu_connected,
-                "reader_connected": result.reader_connected,
-                "port2_enabled": result.port2_enabled,
-                "ant1_health": result.ant1_health,
-                "ant2_health": result.ant2_health,
-                **(metadata or {})
-            },
-            "step_results": [],
-            "tag_step_results": [],
-            "union_results": []
+            "metadata": self._json_metadata(result, metadata),
+            "step_results": [self._step_to_dict(step) for step in result.step_results],
+            "tag_step_results": [self._tagstep_to_dict(ts) for ts in result.tag_step_results],
+            "union_results": [self._union_to_dict(union) for union in result.union_results]
         }
         
-        # Convert step results
-        for step in result.step_results:
-            data["step_results"].append({
-                "timestamp": step.timestamp,
-                "beam_state": step.beam_state,
-                "angle_deg": step.angle_deg,
-                "port_config": step.port_config,
-                "v_ch1": step.v_ch1,
-                "v_ch2": step.v_ch2,
-                "dwell_s": step.dwell_s,
-                "active_antennas": step.active_antennas,
-                "tags_total": step.tags_total,
-                "ant1_unique_epc_n": step.ant1_unique_epc_n,
-                "ant1_targets_seen_n": step.ant1_targets_seen_n,
-                "ant1_total_reads": step.ant1_total_reads,
-                "ant1_rssi_min": step.ant1_rssi_min,
-                "ant1_rssi_max": step.ant1_rssi_max,
-                "ant1_rssi_avg": step.ant1_rssi_avg,
-                "ant2_unique_epc_n": step.ant2_unique_epc_n,
-                "ant2_targets_seen_n": step.ant2_targets_seen_n,
-                "ant2_total_reads": step.ant2_total_reads,
-                "ant2_rssi_min": step.ant2_rssi_min,
-                "ant2_rssi_max": step.ant2_rssi_max,
-                "ant2_rssi_avg": step.ant2_rssi_avg
-            })
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
         
-        # Convert tag step results
-        for ts in result.tag_step_results:
-            data["tag_step_results"].append({
-                "timestamp": ts.timestamp,
-                "beam_state": ts.beam_state,
-                "tag_label": ts.tag_label,
-                "tag_suffix": ts.tag_suffix,
-                "tag_location": ts.tag_location,
-                "active_antennas": ts.active_antennas,
-                "ant1_seen": ts.ant1_seen,
-                "ant1_rssi": ts.ant1_rssi,
-                "ant1_count": ts.ant1_count,
-                "ant1_phase": ts.ant1_phase,
-                "ant2_seen": ts.ant2_seen,
-                "ant2_rssi": ts.ant2_rssi,
-                "ant2_count": ts.ant2_count,
-                "ant2_phase": ts.ant2_phase
-            })
+        if orjson is not None:
+            with _atomic_write(filepath) as tmp, open(tmp, "wb") as f:
+                # Options match json.dump: non-str keys and numpy scalars are
+                # encoded, anything else unknown raises
+                f.write(orjson.dumps(data, option=(
+                    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                )))
+        else:
+            # json.dump issues one write per token; let the buffer absorb them
+            with _atomic_write(filepath) as tmp, \
+                    open(tmp, "w", encoding="utf-8", buffering=self.WRITE_BUFFER_SIZE) as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         
-        # Convert union results
-        for union in result.union_results:
-            data["union_results"].append({
-                "timestamp": union.timestamp,
-                "repeat": union.repeat,
-                "port_config": union.port_config,
-                "dwell_s": union.dwell_s,
-                "active_antennas": union.active_antennas,
-                "tags_total": union.tags_total,
-                "ant1_unique_epcs": union.ant1_unique_epcs,
-                "ant2_unique_epcs": union.ant2_unique_epcs,
-                "ant1_targets_seen": union.ant1_targets_seen,
-                "ant2_targets_seen": union.ant2_targets_seen,
-                "ant1_best_beam": union.ant1_best_beam,
-                "ant2_best_beam": union.ant2_best_beam,
-                "ant1_best_rssi": union.ant1_best_rssi,
-                "ant2_best_rssi": union.ant2_best_rssi
-            })
+        self._log(f"Exported JSON: {filepath}")
+        return str(filepath)
+    
+    def _export_ndjson(
+        self,
+        result: ProtocolResult,
+        filepath: Path,
+        metadata: Optional[Dict] = None
+    ) -> str:
+        """
+        Export to newline-delimited JSON, one record per line.
+        
+        Records are streamed rather than collected into one document, so
+        peak memory stays flat for long runs. Each line carries a
+        "record" key: METADATA, STEP, TAGSTEP or UNION.
+        """
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        
+        if orjson is not None:
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            
+            def dumps(obj) -> bytes:
+                return orjson.dumps(obj, option=options)
+        else:
+            def dumps(obj) -> bytes:
+                return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        
+        records = itertools.chain(
+            ({"record": "METADATA", **self._json_metadata(result, metadata)},),
+            ({"record": "STEP", **self._step_to_dict(step)} for step in result.step_results),
+            ({"record": "TAGSTEP", **self._tagstep_to_dict(ts)} for ts in result.tag_step_results),
+            ({"record": "UNION", **self._union_to_dict(union)} for union in result.union_results),
+        )
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with _atomic_write(filepath) as tmp, open(tmp, "wb", buffering=self.WRITE_BUFFER_SIZE) as f:
+            while True:
+                chunk = list(itertools.islice(records, self.ROW_CHUNK_SIZE))
+                if not chunk:
+                    break
+                f.write(b"\n".join(map(dumps, chunk)) + b"\n")
         
-        print(f"Exported JSON: {filepath}")
+        self._log(f"Exported NDJSON: {filepath}")
         return str(filepath)
     
+    def _json_metadata(self, result: ProtocolResult, metadata: Optional[Dict] = None) -> Dict[str, Any]:
+        """Build the JSON metadata block."""
+        return {
+            "export_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "station": result.station_name,
+            "ref_antenna": result.ref_antenna_name,
+            "start_time": result.start_time,
+            "end_time": result.end_time,
+            "success": result.success,
+            "protocol_dwell_s": result.protocol_dwell_s,
+            "protocol_repeats": result.protocol_repeats,
+            "port_config": result.port_config,
+            "beam_sequence": result.beam_sequence,
+            "active_antennas": result.active_antennas,
+            "mcu_connected": result.mcu_connected,
+            "reader_connected": result.reader_connected,
+            "port2_enabled": result.port2_enabled,
+            "ant1_health": result.ant1_health,
+            "ant2_health": result.ant2_health,
+            **(metadata or {})
+        }
+    
+    def _step_to_dict(self, step) -> Dict[str, Any]:
+        """Convert StepResult to JSON record."""
+        return {
+            "timestamp": step.timestamp,
+            "beam_state": step.beam_state,
+            "angle_deg": step.angle_deg,
+            "port_config": step.port_config,
+            "v_ch1": step.v_ch1,
+            "v_ch2": step.v_ch2,
+            "dwell_s": step.dwell_s,
+            "active_antennas": step.active_antennas,
+            "tags_total": step.tags_total,
+            "ant1_unique_epc_n": step.ant1_unique_epc_n,
+            "ant1_targets_seen_n": step.ant1_targets_seen_n,
+            "ant1_total_reads": step.ant1_total_reads,
+            "ant1_rssi_min": step.ant1_rssi_min,
+            "ant1_rssi_max": step.ant1_rssi_max,
+            "ant1_rssi_avg": step.ant1_rssi_avg,
+            "ant2_unique_epc_n": step.ant2_unique_epc_n,
+            "ant2_targets_seen_n": step.ant2_targets_seen_n,
+            "ant2_total_reads": step.ant2_total_reads,
+            "ant2_rssi_min": step.ant2_rssi_min,
+            "ant2_rssi_max": step.ant2_rssi_max,
+            "ant2_rssi_avg": step.ant2_rssi_avg
+        }
+    
+    def _tagstep_to_dict(self, ts) -> Dict[str, Any]:
+        """Convert TagStepResult to JSON record."""
+        return {
+            "timestamp": ts.timestamp,
+            "beam_state": ts.beam_state,
+            "tag_label": ts.tag_label,
+            "tag_suffix": ts.tag_suffix,
+            "tag_location": ts.tag_location,
+            "active_antennas": ts.active_antennas,
+            "ant1_seen": ts.ant1_seen,
+            "ant1_rssi": ts.ant1_rssi,
+            "ant1_count": ts.ant1_count,
+            "ant1_phase": ts.ant1_phase,
+            "ant2_seen": ts.ant2_seen,
+            "ant2_rssi": ts.ant2_rssi,
+            "ant2_count": ts.ant2_count,
+            "ant2_phase": ts.ant2_phase
+        }
+    
+    def _union_to_dict(self, union) -> Dict[str, Any]:
+        """Convert UnionResult to JSON record."""
+        return {
+            "timestamp": union.timestamp,
+            "repeat": union.repeat,
+            "port_config": union.port_config,
+            "dwell_s": union.dwell_s,
+            "active_antennas": union.active_antennas,
+            "tags_total": union.tags_total,
+            "ant1_unique_epcs": union.ant1_unique_epcs,
+            "ant2_unique_epcs": union.ant2_unique_epcs,
+            "ant1_targets_seen": union.ant1_targets_seen,
+            "ant2_targets_seen": union.ant2_targets_seen,
+            "ant1_best_beam": union.ant1_best_beam,
+            "ant2_best_beam": union.ant2_best_beam,
+            "ant1_best_rssi": union.ant1_best_rssi,
+            "ant2_best_rssi": union.ant2_best_rssi
+        }
+    
     def _export_excel(
         self,
         result: ProtocolResult,
         filepath: Path,
         metadata: Optional[Dict] = None
     ) -> str:
-        """Export to Excel format (requires openpyxl)."""
+        """Export to Excel format (xlsxwriter if available, else openpyxl)."""
+        try:
+            import xlsxwriter
+        except ImportError:
+            pass
+        else:
+            return self._export_excel_streaming(xlsxwriter, result, filepath)
+        
         try:
             from openpyxl import Workbook
-            from openpyxl.styles import Font, PatternFill
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font, NamedStyle, PatternFill
         except ImportError:
-            # Fallback to CSV if openpyxl not available
-            print("openpyxl not available, falling back to CSV")
+            # Fallback to CSV if no Excel writer is available
+            self._log("openpyxl not available, falling back to CSV", "WARNING")
             csv_path = filepath.with_suffix(".csv")
             return self._export_csv(result, csv_path, metadata)
         
-        wb = Workbook()
+        # Write-only mode streams rows to the xlsx instead of keeping Cells
+        wb = Workbook(write_only=True)
+        
+        # Header styles registered once and assigned by name
+        header_style = NamedStyle(name="afsuam_header", font=Font(bold=True))
+        meta_header_style = NamedStyle(
+            name="afsuam_meta_header",
+            font=Font(bold=True),
+            fill=PatternFill(start_color="DBEAFE", fill_type="solid")
+        )
+        wb.add_named_style(header_style)
+        wb.add_named_style(meta_header_style)
+        
+        def header_cells(ws, headers, style):
+            cells = []
+            for value in headers:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = style.name
+                cells.append(cell)
+            return cells
         
         # Metadata sheet
-        ws_meta = wb.active
-        ws_meta.title = "Metadata"
-        ws_meta.append(["Key", "Value"])
-        ws_meta.append(["Station", result.station_name])
-        ws_meta.append(["Reference Antenna", result.ref_antenna_name])
-        ws_meta.append(["Start Time", result.start_time])
-        ws_meta.append(["End Time", result.end_time])
-        ws_meta.append(["Success", str(result.success)])
-        ws_meta.append(["Protocol Dwell", result.protocol_dwell_s])
-        ws_meta.append(["Protocol Repeats", result.protocol_repeats])
-        ws_meta.append(["Port Config", result.port_config])
-        ws_meta.append(["Beam Sequence", result.beam_sequence])
-        ws_meta.append(["Active Antennas", "|".join(str(a) for a in result.active_antennas)])
-        ws_meta.append(["MCU Connected", result.mcu_connected])
-        ws_meta.append(["Reader Connected", result.reader_connected])
-        ws_meta.append(["Ant1 Health", result.ant1_health])
-        ws_meta.append(["Ant2 Health", result.ant2_health])
-        
-        # Style header
-        for cell in ws_meta[1]:
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="DBEAFE", fill_type="solid")
+        ws_meta = wb.create_sheet("Metadata")
+        meta_rows = self._excel_metadata_rows(result)
+        ws_meta.append(header_cells(ws_meta, meta_rows[0], meta_header_style))
+        for row in meta_rows[1:]:
+            ws_meta.append(row)
         
         # Step Results sheet
         if result.step_results:
             ws_steps = wb.create_sheet("Step Results")
-            ws_steps.append(self.STEP_HEADERS)
-            for cell in ws_steps[1]:
-                cell.font = Font(bold=True)
-            for i, step in enumerate(result.step_results):
-                repeat_num = (i // 3) + 1
-                ws_steps.append(self._step_to_row(step, result, repeat_num))
+            ws_steps.append(header_cells(ws_steps, self.STEP_HEADERS, header_style))
+            for row in self._step_rows(result):
+                ws_steps.append(row)
         
         # Union Results sheet
         if result.union_results:
             ws_union = wb.create_sheet("Union Results")
-            ws_union.append(self.UNION_HEADERS)
-            for cell in ws_union[1]:
-                cell.font = Font(bold=True)
-            for union in result.union_results:
-                ws_union.append(self._union_to_row(union, result))
-        
-        wb.save(filepath)
-        print(f"Exported Excel: {filepath}")
+            ws_union.append(header_cells(ws_union, self.UNION_HEADERS, header_style))
+            for row in self._union_rows(result):
+                ws_union.append(row)
+        
+        with _atomic_write(filepath) as tmp:
+            wb.save(tmp)
+        self._log(f"Exported Excel: {filepath}")
         return str(filepath)
     
+    def _export_excel_streaming(self, xlsxwriter, result: ProtocolResult, filepath: Path) -> str:
+        """
+        Export to Excel with xlsxwriter in constant_memory mode.
+        
+        Rows are streamed to disk as they are written instead of being
+        held as openpyxl cell objects, so memory stays flat for long runs.
+        Sheet layout matches the openpyxl path.
+        """
+        def write_sheet(wb, name, header_format, headers, rows):
+            ws = wb.add_worksheet(name)
+            ws.write_row(0, 0, headers, header_format)
+            for row_idx, row in enumerate(rows, 1):
+                ws.write_row(row_idx, 0, row)
+        
+        with _atomic_write(filepath) as tmp:
+            wb = xlsxwriter.Workbook(str(tmp), {"constant_memory": True, "use_zip64": True})
+            bold = wb.add_format({"bold": True})
+            meta_header = wb.add_format({"bold": True, "bg_color": "#DBEAFE", "pattern": 1})
+            try:
+                meta_rows = self._excel_metadata_rows(result)
+                write_sheet(wb, "Metadata", meta_header, meta_rows[0], meta_rows[1:])
+                if result.step_results:
+                    write_sheet(wb, "Step Results", bold, self.STEP_HEADERS, self._step_rows(result))
+                if result.union_results:
+                    write_sheet(wb, "Union Results", bold, self.UNION_HEADERS, self._union_rows(result))
+            finally:
+                wb.close()
+        
+        self._log(f"Exported Excel: {filepath}")
+        return str(filepath)
+    
+    def _excel_metadata_rows(self, result: ProtocolResult) -> List[List]:
+        """Rows of the Excel "Metadata" sheet, header first."""
+        return [
+            ["Key", "Value"],
+            ["Station", result.station_name],
+            ["Reference Antenna", result.ref_antenna_name],
+            ["Start Time", result.start_time],
+            ["End Time", result.end_time],
+            ["Success", str(result.success)],
+            ["Protocol Dwell", result.protocol_dwell_s],
+            ["Protocol Repeats", result.protocol_repeats],
+            ["Port Config", result.port_config],
+            ["Beam Sequence", result.beam_sequence],
+            ["Active Antennas", _join_antennas(result.active_antennas)],
+            ["MCU Connected", result.mcu_connected],
+            ["Reader Connected", result.reader_connected],
+            ["Ant1 Health", result.ant1_health],
+            ["Ant2 Health", result.ant2_health],
+        ]
+    
+    def _export_parquet(
+        self,
+        result: ProtocolResult,
+        filepath: Path,
+        metadata: Optional[Dict] = None
+    ) -> str:
+        """
+        Export to Parquet or Feather/Arrow IPC (requires pandas + pyarrow).
+        
+        Each record kind is written to its own columnar file next to
+        filepath (``<stem>_steps``, ``<stem>_tagsteps``, ``<stem>_union``)
+        since STEP/TAGSTEP/UNION rows have different columns. RUN_METADATA
+        is stored as JSON in each file's schema metadata.
+        
+        Returns:
+            Path to the STEP file (or the first file written)
+        """
+        try:
+            import pandas as pd
+            import pyarrow as pa
+            import pyarrow.feather as feather
+            import pyarrow.parquet as pq
+        except ImportError:
+            # Fallback to CSV if pandas/pyarrow not available
+            self._log("pandas/pyarrow not available, falling back to CSV", "WARNING")
+            csv_path = filepath.with_suffix(".csv")
+            return self._export_csv(result, csv_path, metadata)
+        
+        # .arrow is the Arrow IPC file format, i.e. Feather v2
+        is_feather = filepath.suffix.lower() in (".feather", ".arrow")
+        run_metadata = json.dumps(self._run_metadata(result, metadata), default=str)
+        
+        records = (
+            ("steps", self.STEP_HEADERS, self._step_rows(result)),
+            ("tagsteps", self.TAGSTEP_HEADERS, self._tagstep_rows(result)),
+            ("union", self.UNION_HEADERS, self._union_rows(result)),
+        )
+        
+        written = []
+        for kind, headers, rows in records:
+            rows = list(rows)
+            if not rows:
+                continue
+            df = pd.DataFrame(rows, columns=headers)
+            # Mixed ""/number cells (e.g. formatted RSSI) must be one Arrow type
+            for col in df.columns[df.dtypes == object]:
+                df[col] = df[col].astype("string")
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                b"afsuam_run_metadata": run_metadata.encode("utf-8"),
+            })
+            
+            path = filepath.with_name(f"{filepath.stem}_{kind}{filepath.suffix}")
+            with _atomic_write(path) as tmp:
+                if is_feather:
+                    feather.write_feather(table, str(tmp), compression="zstd")
+                else:
+                    pq.write_table(table, str(tmp), compression="zstd")
+            written.append(path)
+        
+        if not written:
+            self._log(f"Nothing to export: {filepath}")
+            return str(filepath)
+        
+        for path in written:
+            self._log(f"Exported {'Feather' if is_feather else 'Parquet'}: {path}")
+        return str(written[0])
+    
+    def _step_rows(self, result: ProtocolResult):
+        """Yield STEP rows with their repeat number (3 beam steps per repeat)."""
+        step_to_row = self._step_to_row
+        for i, step in enumerate(result.step_results):
+            yield step_to_row(step, result, i // 3 + 1)
+    
+    def _tagstep_rows(self, result: ProtocolResult):
+        """Yield TAGSTEP rows with their repeat number."""
+        # Calculate repeat based on position
+        tags_per_step = len(result.tag_step_results) // max(len(result.step_results), 1)
+        rows_per_repeat = tags_per_step * 3
+        tagstep_to_row = self._tagstep_to_row
+        if not rows_per_repeat:
+            for ts in result.tag_step_results:
+                yield tagstep_to_row(ts, result, 1)
+            return
+        for i, ts in enumerate(result.tag_step_results):
+            yield tagstep_to_row(ts, result, i // rows_per_repeat + 1)
+    
+    def _union_rows(self, result: ProtocolResult):
+        """Yield UNION rows."""
+        for union in result.union_results:
+            yield self._union_to_row(union, result)
+    
     def _step_to_row(self, step, result: ProtocolResult, repeat: int = 1) -> List:
         """Convert StepResult to row with all stats."""
         # Calculate nontarget counts
@@ -469,16 +880,16 @@ class CSVExporter:
             step.v_ch1,
             step.v_ch2,
             step.dwell_s,
-            "|".join(str(a) for a in step.active_antennas),
+            _join_antennas(step.active_antennas),
             step.tags_total,
             # Ant1
             step.ant1_unique_epc_n,
             step.ant1_targets_seen_n,
             ant1_nontarget,
             step.ant1_total_reads,
-            f"{step.ant1_rssi_min:.1f}" if step.ant1_rssi_min is not None else "",
-            f"{step.ant1_rssi_max:.1f}" if step.ant1_rssi_max is not None else "",
-            f"{step.ant1_rssi_avg:.1f}" if step.ant1_rssi_avg is not None else "",
+            _fmt1(step.ant1_rssi_min),
+            _fmt1(step.ant1_rssi_max),
+            _fmt1(step.ant1_rssi_avg),
             "|".join(step.ant1_missed_suffixes),
             "|".join(step.ant1_missed_labels),
             # Ant2
@@ -486,9 +897,9 @@ class CSVExporter:
             step.ant2_targets_seen_n,
             ant2_nontarget,
             step.ant2_total_reads,
-            f"{step.ant2_rssi_min:.1f}" if step.ant2_rssi_min is not None else "",
-            f"{step.ant2_rssi_max:.1f}" if step.ant2_rssi_max is not None else "",
-            f"{step.ant2_rssi_avg:.1f}" if step.ant2_rssi_avg is not None else "",
+            _fmt1(step.ant2_rssi_min),
+            _fmt1(step.ant2_rssi_max),
+            _fmt1(step.ant2_rssi_avg),
             "|".join(step.ant2_missed_suffixes),
             "|".join(step.ant2_missed_labels)
         ]
@@ -504,20 +915,20 @@ class CSVExporter:
             result.run_id,
             ts.beam_state,
             result.port_config,
-            ts.angle_deg if hasattr(ts, 'angle_deg') else "",  # Support angle_deg if available
+            ts.angle_deg if ts.angle_deg is not None else "",
             result.protocol_dwell_s,
-            "|".join(str(a) for a in ts.active_antennas),
+            _join_antennas(ts.active_antennas),
             ts.tag_label,
             ts.tag_suffix,
             ts.tag_location,
             1 if ts.ant1_seen else 0,
-            f"{ts.ant1_rssi:.1f}" if ts.ant1_rssi is not None else "",
+            _fmt1(ts.ant1_rssi),
             ts.ant1_count,
-            f"{ts.ant1_phase:.1f}" if ts.ant1_phase is not None else "",
+            _fmt1(ts.ant1_phase),
             1 if ts.ant2_seen else 0,
-            f"{ts.ant2_rssi:.1f}" if ts.ant2_rssi is not None else "",
+            _fmt1(ts.ant2_rssi),
             ts.ant2_count,
-            f"{ts.ant2_phase:.1f}" if ts.ant2_phase is not None else ""
+            _fmt1(ts.ant2_phase)
         ]
     
     def _union_to_row(self, union, result: ProtocolResult) -> List:
@@ -561,7 +972,7 @@ class CSVExporter:
             result.run_id,
             union.port_config,
             union.dwell_s,
-            "|".join(str(a) for a in union.active_antennas),
+            _join_antennas(union.active_antennas),
             union.tags_total,
             union.ant1_unique_epcs,
             union.ant2_unique_epcs,
@@ -620,44 +1031,147 @@ class CSVExporter:
             data = {
                 "timestamp": datetime.now().isoformat(),
                 "beam": {"port_config": port_config, "angle": angle, "v_ch1": v_ch1, "v_ch2": v_ch2},
-                "tags": []
+                "tags": [
+                    {
+                        "epc": epc,
+                        "suffix": epc[-4:],
+                        "rssi": info.get("rssi", -99),
+                        "phase": info.get("phase", 0),
+                        "count": info.get("count", 0),
+                        "antenna": info.get("antenna", 1)
+                    }
+                    for epc, info in inventory.items()
+                ]
             }
-            for epc, info in inventory.items():
-                data["tags"].append({
-                    "epc": epc,
-                    "suffix": epc[-4:] if len(epc) >= 4 else epc,
-                    "rssi": info.get("rssi", -99),
-                    "phase": info.get("phase", 0),
-                    "count": info.get("count", 0),
-                    "antenna": info.get("antenna", 1)
-                })
             
-            with open(filepath, "w", encoding="utf-8") as f:
+            with _atomic_write(filepath) as tmp, \
+                    open(tmp, "w", encoding="utf-8", buffering=self.WRITE_BUFFER_SIZE) as f:
                 json.dump(data, f, indent=2)
         else:
-            with open(filepath, "w", newline="", encoding="utf-8") as f:
+            with _atomic_write(filepath) as tmp, \
+                    open(tmp, "w", newline="", encoding="utf-8", buffering=self.WRITE_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    "timestamp", "epc", "suffix", "count", "rssi",
-                    "phase", "doppler", "antenna",
-                    "port_config", "angle_deg", "v_ch1", "v_ch2"
-                ])
-                
-                for epc, info in inventory.items():
-                    writer.writerow([
-                        info.get("timestamp", ""),
-                        epc,
-                        epc[-4:] if len(epc) >= 4 else epc,
-                        info.get("count", 0),
-                        info.get("rssi", -99.0),
-                        info.get("phase", 0.0),
-                        info.get("doppler", 0.0),
-                        info.get("antenna", 1),
-                        port_config,
-                        angle,
-                        f"{v_ch1:.3f}",
-                        f"{v_ch2:.3f}"
-                    ])
-        
-        print(f"Exported snapshot: {filepath}")
+                writer.writerow(self.SNAPSHOT_HEADERS)
+                self._write_snapshot_rows(
+                    f, writer, self._snapshot_rows(inventory, port_config, angle, v_ch1, v_ch2)
+                )
+        
+        self._log(f"Exported snapshot: {filepath}")
         return str(filepath)
+    
+    def open_snapshot_stream(self, filename: Optional[str] = None) -> "SnapshotStream":
+        """
+        Open one CSV file for a series of live snapshots.
+        
+        For high-rate live export: the file is opened once and every
+        write() appends a snapshot's rows, instead of creating a new
+        file per snapshot. Use as a context manager.
+        
+        Args:
+            filename: Output filename (auto-generated if None)
+        
+        Returns:
+            SnapshotStream writing to output_dir / filename
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"live_stream_{timestamp}.csv"
+        return SnapshotStream(self, self.output_dir / filename)
+    
+    def _snapshot_rows(
+        self,
+        inventory: Dict[str, Dict],
+        port_config: int,
+        angle: float,
+        v_ch1: float,
+        v_ch2: float
+    ) -> List[tuple]:
+        """Build live snapshot CSV rows (SNAPSHOT_HEADERS order)."""
+        # Beam columns are the same for every row
+        beam = (port_config, angle, f"{v_ch1:.3f}", f"{v_ch2:.3f}")
+        return [
+            (
+                info.get("timestamp", ""),
+                epc,
+                epc[-4:],
+                info.get("count", 0),
+                info.get("rssi", -99.0),
+                info.get("phase", 0.0),
+                info.get("doppler", 0.0),
+                info.get("antenna", 1),
+                *beam
+            )
+            for epc, info in inventory.items()
+        ]
+    
+    def _write_snapshot_rows(self, f, writer, rows: List[tuple]) -> None:
+        """
+        Write snapshot rows as one joined string when no cell needs quoting.
+        
+        Inventory values come from the reader, so instead of checking each
+        cell the joined text is validated afterwards: with no quote and
+        exactly one comma per column gap and one line break per row, no
+        cell contained a delimiter. Otherwise csv.writer handles quoting.
+        """
+        if not rows:
+            return
+        text = "\r\n".join([",".join(["" if c is None else str(c) for c in row]) for row in rows])
+        n = len(rows)
+        if (
+            '"' not in text
+            and text.count(",") == n * (len(self.SNAPSHOT_HEADERS) - 1)
+            and text.count("\n") == n - 1
+            and text.count("\r") == n - 1
+        ):
+            f.write(text)
+            f.write("\r\n")
+        else:
+            writer.writerows(rows)
+
+
+class SnapshotStream:
+    """
+    Appends repeated live snapshots to a single CSV file.
+    
+    Created by CSVExporter.open_snapshot_stream(). Rows match
+    export_live_snapshot's CSV format; the header is written once.
+    """
+    
+    def __init__(self, exporter: CSVExporter, filepath: Path):
+        self.exporter = exporter
+        self.filepath = filepath
+        self.snapshots = 0
+        self._file = open(
+            filepath, "w", newline="", encoding="utf-8",
+            buffering=exporter.WRITE_BUFFER_SIZE
+        )
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(exporter.SNAPSHOT_HEADERS)
+    
+    def write(
+        self,
+        inventory: Dict[str, Dict],
+        port_config: int = 0,
+        angle: float = 0.0,
+        v_ch1: float = 0.0,
+        v_ch2: float = 0.0
+    ):
+        """Append one snapshot's rows."""
+        self.exporter._write_snapshot_rows(
+            self._file, self._writer,
+            self.exporter._snapshot_rows(inventory, port_config, angle, v_ch1, v_ch2)
+        )
+        self.snapshots += 1
+    
+    def close(self) -> str:
+        """Flush and close the file; returns its path."""
+        if not self._file.closed:
+            self._file.close()
+            self.exporter._log(f"Exported {self.snapshots} snapshots: {self.filepath}")
+        return str(self.filepath)
+    
+    def __enter__(self) -> "SnapshotStream":
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
@@ -2,46 +2,84 @@
 Logging utilities for AFSUAM Measurement System.
 """
 
-from datetime import datetime
+import time
+from collections import deque
+from itertools import islice
 from typing import Optional, Callable
 
 
+# Numeric severity per level name; unknown names are always logged
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+
 class Logger:
     """
     Simple logger with callback support for GUI integration.
     """
     
-    def __init__(self, callback: Optional[Callable[[str], None]] = None):
+    def __init__(
+        self,
+        callback: Optional[Callable[[str], None]] = None,
+        max_messages: int = 10000,
+        min_level: str = "INFO",
+        echo: bool = True
+    ):
         """
         Initialize logger.
         
         Args:
             callback: Optional callback for log messages (e.g., to update GUI)
+            max_messages: Number of recent messages kept for get_messages()
+            min_level: Messages below this level (DEBUG, INFO, WARNING,
+                ERROR) are dropped before any formatting
+            echo: Also print messages to stdout
         """
         self._callback = callback
-        self._messages = []
+        self._min_level = _LEVELS[min_level]
+        self._echo = echo
+        self._messages = deque(maxlen=max_messages)
+        # (epoch second, "HH:MM:SS") of the last formatted timestamp;
+        # one tuple so threads never see a mismatched pair
+        self._ts_cache = (-1, "")
     
     def set_callback(self, callback: Callable[[str], None]):
         """Set callback for log messages."""
         self._callback = callback
     
+    def set_level(self, min_level: str):
+        """Set the minimum level that is logged."""
+        self._min_level = _LEVELS[min_level]
+    
     def log(self, message: str, level: str = "INFO"):
         """
         Log a message.
         
         Args:
             message: Log message
-            level: Log level (INFO, WARNING, ERROR)
+            level: Log level (DEBUG, INFO, WARNING, ERROR)
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        # Filtered messages cost one dict lookup, no formatting
+        if _LEVELS.get(level, 40) < self._min_level:
+            return
+        
+        sec = int(time.time())
+        cached_sec, timestamp = self._ts_cache
+        if sec != cached_sec:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._ts_cache = (sec, timestamp)
         formatted = f"[{timestamp}] [{level}] {message}"
         
         self._messages.append(formatted)
-        print(formatted)
+        if self._echo:
+            print(formatted)
         
         if self._callback:
             self._callback(formatted)
     
+    def debug(self, message: str):
+        """Log debug message."""
+        self.log(message, "DEBUG")
+    
     def info(self, message: str):
         """Log info message."""
         self.log(message, "INFO")
@@ -56,8 +94,11 @@ class Logger:
     
     def get_messages(self, count: int = 100) -> list:
         """Get recent log messages."""
-        return self._messages[-count:]
+        # Walk back from the newest entry so only `count` items are touched
+        recent = list(islice(reversed(self._messages), max(count, 0)))
+        recent.reverse()
+        return recent
     
     def clear(self):
         """Clear log messages."""
-        self._messages = []
+        self._messages.clear()